@@ -0,0 +1,104 @@
+"""
+Modal Layout
+============
+
+.. codeauthor:: cmdvmd <vcmd43@gmail.com>
+
+A program to count layout passes while modals open and are dismissed, comparing a presentation that animates the size
+of a modal with the ``'fade'`` and ``'transform'`` presentations of :class:`~kivycupertino.uix.modal.CupertinoDialog`
+and :class:`~kivycupertino.uix.modal.CupertinoActionSheet`
+"""
+
+import os
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from kivy.config import Config
+
+Config.set('graphics', 'maxfps', '0')
+
+from collections import Counter
+from functools import wraps
+from kivy.animation import Animation
+from kivy.base import EventLoop
+from kivy.uix.anchorlayout import AnchorLayout
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.relativelayout import RelativeLayout
+
+CYCLES = 5
+LAYOUTS = Counter()
+
+
+def count_layouts(layout_class):
+    do_layout = layout_class.do_layout
+
+    # Layout triggers hold weak references to the method by name, so the counter keeps the name of the method
+    @wraps(do_layout)
+    def counted(self, *args, **kwargs):
+        LAYOUTS[layout_class.__name__] += 1
+        return do_layout(self, *args, **kwargs)
+
+    layout_class.do_layout = counted
+
+
+# Layouts create their layout triggers when they are created, so they are counted before any modal is imported
+for cls in (AnchorLayout, BoxLayout, GridLayout, RelativeLayout):
+    count_layouts(cls)
+
+from kivycupertino.uix.modal import CupertinoDialog, CupertinoActionSheet, CupertinoModalButton
+
+
+def build(modal_class, presentation):
+    modal = modal_class(title='Delete Message?', message='This message will be deleted from all of your devices',
+                        presentation=presentation)
+    modal.add_widget(CupertinoModalButton(text='Delete', text_color=(1, 0, 0, 1)))
+    modal.add_widget(CupertinoModalButton(text='Archive'))
+    return modal
+
+
+def settle(modal, is_open):
+    frames = 0
+    while modal._is_open != is_open or Animation._instances:
+        EventLoop.idle()
+        frames += 1
+    EventLoop.idle()
+    return frames + 1
+
+
+def measure(modal_class, presentation):
+    modal = build(modal_class, 'fade' if presentation == 'size' else presentation)
+    modal.open(animation=False)
+    EventLoop.idle()
+    modal.dismiss(animation=False)
+    EventLoop.idle()
+
+    width, height = modal.width, modal.height
+    LAYOUTS.clear()
+    frames = 0
+    for _ in range(CYCLES):
+        modal.open()
+        if presentation == 'size':
+            # Zoom the modal in by animating its size, which lays out its content again on every frame
+            modal.size = width * 1.15, height * 1.15
+            Animation(size=(width, height), d=modal._anim_duration).start(modal)
+        frames += settle(modal, True)
+        if presentation == 'size':
+            Animation(size=(width * 1.15, height * 1.15), d=modal._anim_duration).start(modal)
+        modal.dismiss()
+        frames += settle(modal, False)
+        modal.size = width, height
+    return sum(LAYOUTS.values()) / CYCLES, frames / CYCLES
+
+
+def main():
+    EventLoop.ensure_window()
+    print(f'{"modal":<22}{"presentation":<14}{"layouts / cycle":>16}{"frames / cycle":>16}')
+    for modal_class in (CupertinoDialog, CupertinoActionSheet):
+        for presentation in ('size', 'fade', 'transform'):
+            layouts, frames = measure(modal_class, presentation)
+            print(f'{modal_class.__name__:<22}{presentation:<14}{layouts:>16.1f}{frames:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Modal Pool
+==========
+
+.. codeauthor:: cmdvmd <vcmd43@gmail.com>
+
+A program to compare show/dismiss cycles per second of modals that are built every time they are shown with modals
+reused from a :class:`~kivycupertino.uix.modal.CupertinoModalPool`
+"""
+
+import os
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from kivy.config import Config
+
+Config.set('graphics', 'maxfps', '0')
+
+from time import perf_counter
+from kivy.base import EventLoop
+from kivycupertino.uix.modal import CupertinoDialog, CupertinoActionSheet, CupertinoModalButton, CupertinoModalPool
+
+CYCLES = 200
+ACTIONS = [
+    {'text': 'Delete', 'text_color': (1, 0, 0, 1)},
+    {'text': 'Archive'},
+    {'text': 'Cancel', 'cancel': True}
+]
+
+
+def build(modal_class):
+    modal = modal_class(title='Delete Message?', message='This message will be deleted from all of your devices')
+    for action in ACTIONS:
+        if modal_class is CupertinoDialog and action.get('cancel'):
+            continue
+        modal.add_widget(CupertinoModalButton(**action))
+    return modal
+
+
+def cycle(modal):
+    modal.open(animation=False)
+    EventLoop.idle()
+    modal.dismiss(animation=False)
+    EventLoop.idle()
+
+
+def measure(modal_class, pool):
+    actions = [action for action in ACTIONS if modal_class is CupertinoActionSheet or not action.get('cancel')]
+    start = perf_counter()
+    for _ in range(CYCLES):
+        if pool is None:
+            modal = build(modal_class)
+        else:
+            modal = pool.acquire(actions, title='Delete Message?',
+                                 message='This message will be deleted from all of your devices')
+        cycle(modal)
+    return CYCLES / (perf_counter() - start)
+
+
+def main():
+    EventLoop.ensure_window()
+    for modal_class in [CupertinoDialog, CupertinoActionSheet]:
+        pool = CupertinoModalPool(modal_class=modal_class)
+        pool.prepare()
+        built = measure(modal_class, None)
+        pooled = measure(modal_class, pool)
+        print(f'{modal_class.__name__}: built {built:.0f} cycles/s, pooled {pooled:.0f} cycles/s '
+              f'(created {pool.created}, reused {pool.reused}, released {pool.released})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Page Transition
+===============
+
+.. codeauthor:: cmdvmd <vcmd43@gmail.com>
+
+A program to compare the time of frames while switching between screens of increasing complexity with Kivy's
+:class:`~kivy.uix.screenmanager.SlideTransition` and :class:`~kivycupertino.uix.page.CupertinoTransition`
+"""
+
+import os
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from kivy.config import Config
+
+Config.set('graphics', 'maxfps', '0')
+
+from statistics import mean, median
+from time import perf_counter
+from kivy.base import EventLoop
+from kivy.core.window import Window
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.screenmanager import Screen, SlideTransition
+from kivycupertino.uix.label import CupertinoLabel
+from kivycupertino.uix.page import CupertinoScreenManager, CupertinoTransition
+
+SWITCHES = 4
+WIDGETS = (50, 200, 800)
+
+
+def build(name, widgets):
+    screen = Screen(name=name)
+    grid = GridLayout(cols=10)
+    for i in range(widgets):
+        grid.add_widget(CupertinoLabel(text=str(i)))
+    screen.add_widget(grid)
+    return screen
+
+
+def measure(transition, widgets):
+    manager = CupertinoScreenManager(transition=transition)
+    manager.add_widget(build('first', widgets))
+    manager.add_widget(build('second', widgets))
+    Window.add_widget(manager)
+    for _ in range(3):
+        EventLoop.idle()
+
+    frames = []
+    for _ in range(SWITCHES):
+        manager.current = manager.next()
+        while manager.transition.is_active:
+            start = perf_counter()
+            EventLoop.idle()
+            frames.append((perf_counter() - start) * 1000)
+        EventLoop.idle()
+
+    Window.remove_widget(manager)
+    return mean(frames), median(frames)
+
+
+def main():
+    EventLoop.ensure_window()
+    print('Frame time in ms (mean / median)')
+    print(f'{"widgets per screen":<20}{"SlideTransition":>20}{"CupertinoTransition":>24}')
+    for widgets in WIDGETS:
+        slide = '{:.2f} / {:.2f}'.format(*measure(SlideTransition(duration=0.35), widgets))
+        cupertino = '{:.2f} / {:.2f}'.format(*measure(CupertinoTransition(), widgets))
+        print(f'{widgets:<20}{slide:>20}{cupertino:>24}')
+
+
+if __name__ == '__main__':
+    main()
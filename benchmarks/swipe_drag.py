@@ -0,0 +1,63 @@
+"""
+Swipe Drag
+==========
+
+.. codeauthor:: cmdvmd <vcmd43@gmail.com>
+
+A program to measure the time taken to drag a :class:`~kivycupertino.uix.swipe.CupertinoSwipe`
+"""
+
+import os
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from time import perf_counter
+from kivy.input.motionevent import MotionEvent
+from kivycupertino.uix.swipe import CupertinoSwipe, CupertinoSwipeAction
+
+EVENTS = 1000
+ROUNDS = 20
+
+
+class BenchmarkTouch(MotionEvent):
+    def depack(self, args):
+        self.sx, self.sy = args
+        super().depack(args)
+
+
+def create_swipe():
+    swipe = CupertinoSwipe(size=(400, 60))
+    for side in ['left', 'left', 'right', 'right', 'right']:
+        swipe.add_widget(CupertinoSwipeAction(side=side, size_hint_x=0.15))
+    return swipe
+
+
+def drag(swipe, touch):
+    touch.x = 200
+    swipe.on_touch_down(touch)
+    for event in range(EVENTS):
+        touch.x = 200 - 150 * ((event % 200) / 100 - 1) ** 2
+        swipe.on_touch_move(touch)
+    touch.grab_current = None
+
+
+def main():
+    swipe = create_swipe()
+    touch = BenchmarkTouch('benchmark', 0, (0.5, 0.5))
+    touch.scale_for_screen(400, 60)
+    touch.grab_current = swipe
+    drag(swipe, touch)
+
+    times = []
+    for _ in range(ROUNDS):
+        touch.grab_current = swipe
+        start = perf_counter()
+        drag(swipe, touch)
+        times.append(perf_counter() - start)
+
+    best = min(times)
+    print(f'{EVENTS} move events: best {best * 1000:.2f} ms ({best / EVENTS * 1e6:.2f} us/event)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Swipe Scroll
+============
+
+.. codeauthor:: cmdvmd <vcmd43@gmail.com>
+
+A program to compare frame times of a list of :class:`~kivycupertino.uix.swipe.CupertinoSwipe` with each mode of
+:attr:`~kivycupertino.uix.swipe.CupertinoSwipe.clipping`, both while it is scrolled and while it is only redrawn
+"""
+
+import os
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from kivy.config import Config
+
+Config.set('graphics', 'maxfps', '0')
+
+from statistics import median
+from time import perf_counter
+from kivy.base import EventLoop
+from kivy.core.window import Window
+from kivy.lang.builder import Builder
+from kivy.metrics import dp
+from kivycupertino.uix.table import CupertinoTableView
+
+ROWS = 2000
+VISIBLE_ROWS = 40
+FRAMES = 300
+
+Builder.load_string("""
+<BenchmarkRow@CupertinoSwipe>:
+    text: ''
+
+    CupertinoLabel:
+        text: root.text
+    CupertinoSwipeAction:
+        side: 'left'
+        symbol: 'pin_fill'
+        text: 'Pin'
+        color_normal: 1, 0.6, 0, 1
+    CupertinoSwipeAction:
+        side: 'right'
+        symbol: 'trash_fill'
+        text: 'Delete'
+""")
+
+
+def measure(clipping):
+    table = CupertinoTableView(viewclass='BenchmarkRow', size_hint=(None, None),
+                               size=(Window.width, VISIBLE_ROWS * dp(44)))
+    table.data = [{'text': f'Row {index}', 'clipping': clipping} for index in range(ROWS)]
+    Window.add_widget(table)
+    for _ in range(10):
+        EventLoop.idle()
+
+    scrolling = []
+    for frame in range(FRAMES):
+        table.scroll_y = 1 - (frame % 100) / 100
+        start = perf_counter()
+        EventLoop.idle()
+        scrolling.append(perf_counter() - start)
+
+    # Redrawing without scrolling leaves out laying out and recycling rows, so it shows the cost of clipping them
+    drawing = []
+    for frame in range(FRAMES):
+        Window.canvas.ask_update()
+        start = perf_counter()
+        EventLoop.idle()
+        drawing.append(perf_counter() - start)
+
+    Window.remove_widget(table)
+    return median(scrolling), median(drawing)
+
+
+def main():
+    Window.size = (400, VISIBLE_ROWS * dp(44))
+    Window.clearcolor = (1, 1, 1, 1)
+    print(f'{"clipping":<12}{"scrolling frame":>18}{"drawing frame":>18}')
+    for clipping in ['stencil', 'scissor']:
+        scrolling, drawing = measure(clipping)
+        print(f'{clipping:<12}{scrolling * 1000:>15.2f} ms{drawing * 1000:>15.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
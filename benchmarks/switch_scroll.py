@@ -0,0 +1,104 @@
+"""
+Switch Scroll
+=============
+
+.. codeauthor:: cmdvmd <vcmd43@gmail.com>
+
+A program to count animations and compare frame times while scrolling and moving a settings screen of
+:class:`~kivycupertino.uix.switch.CupertinoSwitch`, comparing switches that animate their state again whenever they
+are moved with switches that snap to their state at most once per frame
+"""
+
+import os
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from kivy.config import Config
+
+Config.set('graphics', 'maxfps', '0')
+
+from time import perf_counter
+from kivy.animation import Animation
+from kivy.base import EventLoop
+from kivy.core.window import Window
+from kivy.metrics import dp
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.floatlayout import FloatLayout
+from kivy.uix.gridlayout import GridLayout
+from kivycupertino.uix.label import CupertinoLabel
+from kivycupertino.uix.scrollview import CupertinoScrollView
+from kivycupertino.uix.switch import CupertinoSwitch
+
+SWITCHES = 50
+FRAMES = 300
+ANIMATIONS = [0]
+
+
+class AnimatedSwitch(CupertinoSwitch):
+    """
+    A switch that starts the animations of its state again whenever it is moved
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.unbind(pos=self._trigger_snap)
+        self.bind(pos=lambda instance, value: self.on_toggled(instance, self.toggled))
+
+
+def count_animations():
+    start = Animation.start
+
+    def counted(self, widget):
+        ANIMATIONS[0] += 1
+        return start(self, widget)
+
+    Animation.start = counted
+
+
+def measure(switch_class, scenario):
+    settings = GridLayout(cols=1, size_hint_y=None)
+    settings.bind(minimum_height=settings.setter('height'))
+    for index in range(SWITCHES):
+        row = BoxLayout(size_hint_y=None, height=dp(44), padding=(dp(16), dp(6)))
+        row.add_widget(CupertinoLabel(text=f'Setting {index}', halign='left', valign='middle'))
+        row.add_widget(switch_class(toggled=index % 2 == 0, size_hint_x=None, width=dp(52)))
+        settings.add_widget(row)
+
+    # Scrolling moves the content with a canvas translation, while moving the settings themselves (such as when they
+    # are pushed up by the keyboard or a sheet) lays out every row and moves every switch
+    root = CupertinoScrollView() if scenario == 'scroll' else FloatLayout()
+    root.add_widget(settings)
+    Window.add_widget(root)
+    for _ in range(10):
+        EventLoop.idle()
+    while Animation._instances:
+        EventLoop.idle()
+
+    ANIMATIONS[0] = 0
+    times = []
+    for frame in range(FRAMES):
+        if scenario == 'scroll':
+            root.scroll_y = 1 - (frame % 100) / 100
+        else:
+            settings.top = Window.height + dp(frame % 100)
+        start = perf_counter()
+        EventLoop.idle()
+        times.append(perf_counter() - start)
+
+    Window.remove_widget(root)
+    times.sort()
+    return ANIMATIONS[0] / FRAMES, times[len(times) // 2], times[int(len(times) * 0.95)]
+
+
+def main():
+    count_animations()
+    EventLoop.ensure_window()
+    print(f'{"scenario":<12}{"switch":<12}{"animations / frame":>20}{"median frame":>16}{"95th percentile":>18}')
+    for scenario in ('scroll', 'relayout'):
+        for name, switch_class in (('animated', AnimatedSwitch), ('snapped', CupertinoSwitch)):
+            animations, median, slowest = measure(switch_class, scenario)
+            print(f'{scenario:<12}{name:<12}{animations:>20.1f}{median * 1000:>13.2f} ms{slowest * 1000:>15.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
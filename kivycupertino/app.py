@@ -1,4 +1,7 @@
+import asyncio
 from kivy.app import App
+from kivy.logger import Logger
+from kivy.properties import BooleanProperty
 
 __all__ = [
     'CupertinoApp'
@@ -7,5 +10,93 @@ __all__ = [
 
 class CupertinoApp(App):
     """
-    An app class for Kivy Cupertino
+    An app class for Kivy Cupertino. If :attr:`use_asyncio` is ``True``, the app runs Kivy's event loop inside an
+    :mod:`asyncio` event loop, so coroutines such as :meth:`~kivycupertino.uix.modal.CupertinoDialog.present` can be
+    awaited without blocking the UI
+
+    **Python**
+
+    .. code-block:: python
+
+       class MailApp(CupertinoApp):
+           def confirm_delete(self):
+               self.create_task(self.delete_message())
+
+           async def delete_message(self):
+               action = await self.root.ids.dialog.present()
+               if action is not None and action.text == 'Delete':
+                   await self.mail.delete()
+
+       MailApp(use_asyncio=True).run()
+    """
+
+    use_asyncio = BooleanProperty(False)
+    """
+    If :meth:`run` should run the app inside an :mod:`asyncio` event loop. :func:`asyncio.run` is used, so the app
+    cannot be run this way from a thread with an event loop already running. In that case, await
+    :meth:`~kivy.app.App.async_run` instead
+
+    **Python**
+
+    .. code-block:: python
+
+       MailApp(use_asyncio=True).run()
     """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoApp`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoApp`
+        """
+
+        self._tasks = set()
+        super().__init__(**kwargs)
+        self.bind(on_stop=lambda *args: self.cancel_tasks())
+
+    def run(self):
+        """
+        Run the app, inside an :mod:`asyncio` event loop if :attr:`use_asyncio` is ``True``
+        """
+
+        if not self.use_asyncio:
+            super().run()
+            return
+        asyncio.run(self.async_run(async_lib='asyncio'))
+
+    def create_task(self, coroutine):
+        """
+        Run a coroutine in the event loop of :class:`CupertinoApp`, keeping a reference to it until it is done.
+        Exceptions raised by the coroutine are logged, and coroutines still running are cancelled when the app stops.
+        Requires :attr:`use_asyncio` to be ``True``
+
+        :param coroutine: Coroutine to run
+        :return: :class:`asyncio.Task` running :param coroutine:
+        """
+
+        if not self.use_asyncio:
+            coroutine.close()
+            raise RuntimeError('CupertinoApp.create_task requires use_asyncio to be True')
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task):
+        """
+        Callback when a task created by :meth:`create_task` is done
+
+        :param task: The task
+        """
+
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            Logger.error('CupertinoApp: Task failed', exc_info=task.exception())
+
+    def cancel_tasks(self):
+        """
+        Cancel all tasks created by :meth:`create_task` that are still running
+        """
+
+        for task in list(self._tasks):
+            task.cancel()
@@ -10,6 +10,7 @@ r('CupertinoNavigationBar', module='kivycupertino.uix.bar')
 r('CupertinoToolbar', module='kivycupertino.uix.bar')
 r('CupertinoTab', module='kivycupertino.uix.bar')
 r('CupertinoTabBar', module='kivycupertino.uix.bar')
+r('CupertinoTabController', module='kivycupertino.uix.bar')
 
 r('LongPressBehavior', module='kivycupertino.uix.behavior')
 r('SelectableBehavior', module='kivycupertino.uix.behavior')
@@ -31,6 +32,7 @@ r('CupertinoProgressBar', module='kivycupertino.uix.indicator')
 
 r('CupertinoLabel', module='kivycupertino.uix.label')
 
+r('CupertinoNavigationController', module='kivycupertino.uix.page')
 r('CupertinoScreenManager', module='kivycupertino.uix.page')
 r('CupertinoPageControls', module='kivycupertino.uix.page')
 
@@ -47,7 +49,13 @@ r('CupertinoSymbol', module='kivycupertino.uix.symbol')
 
 r('CupertinoTableCell', module='kivycupertino.uix.table')
 r('CupertinoClickableTableCell', module='kivycupertino.uix.table')
+r('CupertinoTextTableCell', module='kivycupertino.uix.table')
+r('CupertinoTableLoadingCell', module='kivycupertino.uix.table')
+r('CupertinoTableHeader', module='kivycupertino.uix.table')
 r('CupertinoTableGroup', module='kivycupertino.uix.table')
+r('CupertinoTableLayout', module='kivycupertino.uix.table')
+r('CupertinoTableView', module='kivycupertino.uix.table')
+r('CupertinoTableIndex', module='kivycupertino.uix.table')
 
 r('CupertinoTextField', module='kivycupertino.uix.textinput')
 r('CupertinoTextView', module='kivycupertino.uix.textinput')
@@ -0,0 +1,172 @@
+"""
+Backdrops show a blurred copy of the content behind translucent widgets such as modals and bars
+"""
+
+from kivy.event import EventDispatcher
+from kivy.graphics import Fbo, ClearColor, ClearBuffers, Rectangle, Scale, Translate
+from kivy.properties import NumericProperty, ObjectProperty
+from kivy.metrics import dp
+
+__all__ = [
+    'CupertinoBackdrop'
+]
+
+_BLUR_SHADER = """
+$HEADER$
+
+uniform vec2 direction;
+
+void main(void) {
+    vec4 color = texture2D(texture0, tex_coord0) * 0.2270270270;
+    color += texture2D(texture0, tex_coord0 + direction * 1.3846153846) * 0.3162162162;
+    color += texture2D(texture0, tex_coord0 - direction * 1.3846153846) * 0.3162162162;
+    color += texture2D(texture0, tex_coord0 + direction * 3.2307692308) * 0.0702702703;
+    color += texture2D(texture0, tex_coord0 - direction * 3.2307692308) * 0.0702702703;
+    gl_FragColor = color * frag_color;
+}
+"""
+"""
+Fragment shader of one pass of a separable 9-tap Gaussian blur, sampling between texels to read two texels at once
+"""
+
+
+class CupertinoBackdrop(EventDispatcher):
+    """
+    Renderer of a blurred copy of widgets into :attr:`texture`. The widgets are rendered to a downsampled
+    :class:`~kivy.graphics.Fbo` that is blurred horizontally and then vertically, and the framebuffers are kept to be
+    reused by the next call of :meth:`render` with the same size
+
+    **Python**
+
+    .. code-block:: python
+
+       backdrop = CupertinoBackdrop(blur_radius=30)
+       backdrop.render(Window.children, 0, 0, *Window.size)
+       Rectangle(texture=backdrop.texture, size=Window.size)
+    """
+
+    blur_radius = NumericProperty(dp(20))
+    """
+    Distance in pixels that content of :class:`CupertinoBackdrop` is blurred over
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoBackdrop(blur_radius=30)
+    """
+
+    downsample = NumericProperty(4)
+    """
+    Factor the content of :class:`CupertinoBackdrop` is scaled down by before being blurred
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoBackdrop(downsample=2)
+    """
+
+    texture = ObjectProperty(None, allownone=True)
+    """
+    Texture of the blurred content rendered by :meth:`render` (``None`` until content is rendered)
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoBackdrop`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoBackdrop`
+        """
+
+        self._size = None
+        self._scene = None
+        self._passes = ()
+        self._transform = ()
+        super().__init__(**kwargs)
+
+    def _create_framebuffers(self, size):
+        """
+        Create the framebuffers to render and blur content of a size
+
+        :param size: Size of the downsampled content
+        """
+
+        self._size = size
+        self._scene = Fbo(size=size, with_stencilbuffer=True)
+        with self._scene:
+            self._clear_color = ClearColor(1, 1, 1, 1)
+            ClearBuffers()
+            self._transform = (Scale(1, 1, 1), Translate(0, 0, 0))
+
+        texture = self._scene.texture
+        passes = []
+        for _ in range(2):
+            blur = Fbo(size=size)
+            blur.shader.fs = _BLUR_SHADER
+            with blur:
+                ClearColor(0, 0, 0, 0)
+                ClearBuffers()
+                Rectangle(size=size, texture=texture)
+            passes.append(blur)
+            texture = blur.texture
+        self._passes = tuple(passes)
+
+    def render(self, widgets, x, y, width, height, clear_color=(1, 1, 1, 1)):
+        """
+        Render a blurred copy of an area of widgets to :attr:`texture`
+
+        :param widgets: Widgets to render, from bottom to top, which must share a parent
+        :param x: Horizontal position of the area in the coordinates of the parent of :param widgets:
+        :param y: Vertical position of the area in the coordinates of the parent of :param widgets:
+        :param width: Width of the area
+        :param height: Height of the area
+        :param clear_color: Color behind :param widgets:
+        """
+
+        downsample = max(1, self.downsample)
+        size = max(1, int(width / downsample)), max(1, int(height / downsample))
+        if size != self._size:
+            self._create_framebuffers(size)
+
+        scale, translate = self._transform
+        scale.x = size[0] / width
+        scale.y = size[1] / height
+        translate.x, translate.y = -x, -y
+        self._clear_color.rgba = clear_color
+
+        # A canvas can only have one parent, so each canvas is moved into the framebuffer while it is drawn
+        moved = []
+        for widget in widgets:
+            parent_canvas = widget.parent.canvas if widget.parent is not None else None
+            index = parent_canvas.indexof(widget.canvas) if parent_canvas is not None else -1
+            if index > -1:
+                parent_canvas.remove(widget.canvas)
+                moved.append((parent_canvas, index, widget.canvas))
+            self._scene.add(widget.canvas)
+        try:
+            self._scene.draw()
+        finally:
+            for widget in widgets:
+                self._scene.remove(widget.canvas)
+            for parent_canvas, index, canvas in reversed(moved):
+                parent_canvas.insert(index, canvas)
+
+        step = self.blur_radius / downsample / 3.2307692308
+        horizontal, vertical = self._passes
+        horizontal['direction'] = (step / size[0], 0.)
+        vertical['direction'] = (0., step / size[1])
+        horizontal.draw()
+        vertical.draw()
+        self.texture = vertical.texture
+
+    def release(self):
+        """
+        Free the framebuffers and :attr:`texture` of :class:`CupertinoBackdrop`
+        """
+
+        self._size = None
+        self._scene = None
+        self._passes = ()
+        self._transform = ()
+        self.texture = None
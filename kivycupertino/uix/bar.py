@@ -5,30 +5,46 @@ contain widgets and/or information for easy access by users
 
 from kivy.uix.relativelayout import RelativeLayout
 from kivy.uix.boxlayout import BoxLayout
-from kivycupertino.uix.behavior import SelectableBehavior
-from kivy.properties import ColorProperty, StringProperty
+from kivycupertino.uix.behavior import SelectableBehavior, SelectionGroup
+from kivycupertino.uix.backdrop import CupertinoBackdrop
+from kivy.properties import ColorProperty, StringProperty, NumericProperty, ObjectProperty, BooleanProperty
+from kivy.graphics import Color, Rectangle, PushMatrix, PopMatrix, Translate, Scale, InstructionGroup
+from kivy.core.text import Label as CoreLabel
+from kivy.core.window import Window
+from kivy.metrics import dp, sp
+from kivy.clock import Clock
 from kivy.lang.builder import Builder
 
 __all__ = [
     'CupertinoNavigationBar',
     'CupertinoToolbar',
     'CupertinoTab',
-    'CupertinoTabBar'
+    'CupertinoTabBar',
+    'CupertinoTabController'
 ]
 
 Builder.load_string("""
+<_CupertinoBar>:
+    canvas.before:
+        Color:
+            rgba: 1, 1, 1, 1 if self._backdrop_texture else 0
+        Rectangle:
+            texture: self._backdrop_texture
+            size: self.size if self._backdrop_texture else (0, 0)
+            pos: 0, 0
+
 <CupertinoNavigationBar>:
     canvas.before:
         Color:
             rgba: root.color
         Rectangle:
-            size: self.size
-            pos: 0, 0
+            size: self.width, self.height - self._collapse
+            pos: 0, self._collapse
         Color:
             rgba: 0.8, 0.8, 0.8, 1
         Rectangle:
             size: self.width, dp(1)
-            pos: 0, 0
+            pos: 0, self._collapse
 
 <CupertinoToolbar>:
     canvas.before:
@@ -67,10 +83,99 @@ Builder.load_string("""
         padding: dp(3)
         size: root.size
         pos: 0, 0
+
+<CupertinoTabController>:
+    _content: content
+    _tab_bar: tab_bar
+    orientation: 'vertical'
+
+    FloatLayout:
+        id: content
+    CupertinoTabBar:
+        id: tab_bar
+        size_hint_y: None
+        height: dp(50)
 """)
 
 
-class CupertinoNavigationBar(RelativeLayout):
+class _CupertinoBar(RelativeLayout):
+    """
+    Base class for bars that can blur the content behind them
+    """
+
+    blur_radius = NumericProperty(0)
+    """
+    Distance in pixels that the widgets drawn behind a bar (those added to its parent before it) are blurred over
+    (``0`` to not blur). The bar should have a translucent color for the blurred content to be visible. The blurred
+    content is only rendered again when the bar is moved or resized, so :meth:`invalidate_backdrop` should be called
+    when the content behind the bar changes, for example when it is scrolled
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoNavigationBar(blur_radius=20, color=(0.95, 0.95, 0.95, 0.8))
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoNavigationBar:
+           blur_radius: 20
+           color: 0.95, 0.95, 0.95, 0.8
+    """
+
+    _backdrop_texture = ObjectProperty(None, allownone=True)
+    """
+    Texture of the blurred content behind a bar
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`_CupertinoBar`
+
+        :param kwargs: Keyword arguments for :class:`_CupertinoBar`
+        """
+
+        self._backdrop = None
+        self._trigger_backdrop = Clock.create_trigger(self._render_backdrop)
+        super().__init__(**kwargs)
+        self.bind(
+            blur_radius=self._trigger_backdrop,
+            parent=self._trigger_backdrop,
+            pos=self._trigger_backdrop,
+            size=self._trigger_backdrop
+        )
+
+    def _render_backdrop(self, *args):
+        """
+        Render the blurred widgets behind a bar if :attr:`blur_radius` is set
+
+        :param args: Arguments of the callback
+        """
+
+        if not self.blur_radius or self.parent is None:
+            self._backdrop_texture = None
+            return
+        if self._backdrop is None:
+            self._backdrop = CupertinoBackdrop()
+
+        siblings = self.parent.children
+        below = siblings[siblings.index(self) + 1:]
+        self._backdrop.blur_radius = self.blur_radius
+        self._backdrop.render(below[::-1], self.x, self.y, self.width, self.height, Window.clearcolor)
+        self._backdrop_texture = self._backdrop.texture
+
+    def invalidate_backdrop(self):
+        """
+        Render the blurred widgets behind a bar again on the next frame, for example when they are scrolled
+        """
+
+        if self.blur_radius:
+            self._trigger_backdrop()
+
+
+class CupertinoNavigationBar(_CupertinoBar):
     """
     iOS style Navigation Bar. :class:`CupertinoNavigationBar` is a
     :class:`~kivy.uix.relativelayout.RelativeLayout` and can accept any number of widgets
@@ -98,8 +203,213 @@ class CupertinoNavigationBar(RelativeLayout):
            color: 0.5, 0, 0, 1
     """
 
+    title = StringProperty('')
+    """
+    Title of :class:`CupertinoNavigationBar`
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoNavigationBar(title='Mailboxes')
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoNavigationBar:
+           title: 'Mailboxes'
+    """
+
+    title_color = ColorProperty([0, 0, 0, 1])
+    """
+    Color of the title of :class:`CupertinoNavigationBar`
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoNavigationBar(title_color=(0.5, 0, 0, 1))
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoNavigationBar:
+           title_color: 0.5, 0, 0, 1
+    """
 
-class CupertinoToolbar(RelativeLayout):
+    large_title = BooleanProperty(False)
+    """
+    If the title of :class:`CupertinoNavigationBar` is shown as a large title in the bottom
+    :attr:`large_title_height` of the bar, which shrinks into the inline title as :attr:`scroll_view` is scrolled.
+    The bar is not resized while it collapses, so it should be drawn over :attr:`scroll_view`, whose content should
+    leave room for the expanded bar at its top
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoNavigationBar(title='Mailboxes', large_title=True, scroll_view=scroll_view, height=dp(96))
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoNavigationBar:
+           title: 'Mailboxes'
+           large_title: True
+           scroll_view: scroll_view
+           height: dp(96)
+    """
+
+    large_title_height = NumericProperty('52dp')
+    """
+    Height of the part of :class:`CupertinoNavigationBar` showing the large title, which is collapsed as
+    :attr:`scroll_view` is scrolled
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoNavigationBar(large_title_height=dp(60))
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoNavigationBar:
+           large_title_height: dp(60)
+    """
+
+    scroll_view = ObjectProperty(None, allownone=True)
+    """
+    Instance of :class:`~kivycupertino.uix.scrollview.CupertinoScrollView` whose scrolling collapses the large
+    title of :class:`CupertinoNavigationBar`
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoNavigationBar:
+           scroll_view: scroll_view
+    """
+
+    _collapse = NumericProperty(0)
+    """
+    Height in pixels that the background of :class:`CupertinoNavigationBar` is collapsed by
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoNavigationBar`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoNavigationBar`
+        """
+
+        self._scroll_view = None
+        self._rendered_titles = None
+        self._trigger_titles = Clock.create_trigger(self._render_titles)
+        super().__init__(**kwargs)
+
+        # Both titles are rendered to textures once, and collapsing only changes the instructions drawing them. They
+        # are drawn before the matrix of the bar is popped, so they are positioned relative to the bar
+        titles = InstructionGroup()
+        self._inline_color = Color(rgba=self.title_color)
+        self._inline_rect = Rectangle()
+        self._large_translate = Translate()
+        self._large_scale = Scale()
+        self._large_color = Color(rgba=self.title_color)
+        self._large_rect = Rectangle()
+        for instruction in (self._inline_color, self._inline_rect, PushMatrix(), self._large_translate,
+                            self._large_scale, self._large_color, self._large_rect, PopMatrix()):
+            titles.add(instruction)
+        self.canvas.after.insert(0, titles)
+
+        self.bind(
+            title=self._trigger_titles,
+            large_title=self._trigger_titles,
+            size=self._trigger_titles,
+            large_title_height=self._trigger_titles,
+            title_color=self._update_collapse
+        )
+        self._render_titles()
+        self.on_scroll_view(self, self.scroll_view)
+
+    def on_scroll_view(self, instance, scroll_view):
+        """
+        Callback when :attr:`scroll_view` of :class:`CupertinoNavigationBar` is changed
+
+        :param instance: Instance of :class:`CupertinoNavigationBar`
+        :param scroll_view: Instance of :class:`~kivycupertino.uix.scrollview.CupertinoScrollView`
+        """
+
+        if not hasattr(self, '_large_rect'):
+            return
+        if self._scroll_view is not None:
+            self._scroll_view.unbind(scroll_y=self._update_collapse, height=self._update_collapse)
+        self._scroll_view = scroll_view
+        if scroll_view is not None:
+            scroll_view.bind(scroll_y=self._update_collapse, height=self._update_collapse)
+        self._update_collapse()
+
+    def _render_titles(self, *args):
+        """
+        Render the textures of the inline and large titles of :class:`CupertinoNavigationBar` and position them. The
+        textures are only rendered again when the title or its font size changes, so resizing the bar only moves them
+
+        :param args: Arguments of the callback
+        """
+
+        rendered = self.title, self.large_title, sp(17)
+        if rendered != self._rendered_titles:
+            self._rendered_titles = rendered
+            inline = CoreLabel(text=self.title, font_name='San Francisco', font_size=sp(17), bold=True)
+            inline.refresh()
+            self._inline_rect.texture = inline.texture
+            self._inline_rect.size = inline.texture.size
+            if self.large_title:
+                large = CoreLabel(text=self.title, font_name='San Francisco', font_size=sp(34), bold=True)
+                large.refresh()
+                self._large_rect.texture = large.texture
+                self._large_rect.size = large.texture.size
+            else:
+                self._large_rect.texture = None
+                self._large_rect.size = 0, 0
+
+        inline_width, inline_height = self._inline_rect.size
+        top = self.height - self.large_title_height if self.large_title else self.height
+        self._inline_rect.pos = (self.width - inline_width) / 2, (top - inline_height) / 2 + self.height - top
+        if self.large_title:
+            self._large_rect.pos = dp(16), (self.large_title_height - self._large_rect.size[1]) / 2
+            self._large_scale.origin = self._large_rect.pos
+        self._update_collapse()
+
+    def _update_collapse(self, *args):
+        """
+        Collapse the large title of :class:`CupertinoNavigationBar` by the distance :attr:`scroll_view` is scrolled
+        from its top
+
+        :param args: Arguments of the callback
+        """
+
+        scroll_view = self._scroll_view
+        distance = 0
+        if self.large_title and scroll_view is not None and scroll_view._viewport is not None:
+            distance = (1 - scroll_view.scroll_y) * max(0, scroll_view._viewport.height - scroll_view.height)
+        progress = min(1, max(0, distance / self.large_title_height)) if self.large_title else 1
+
+        # The large title moves with the content and grows slightly when the content is pulled down
+        self._large_translate.y = min(distance, self.large_title_height)
+        scale = 1 + min(0.1, max(0, -distance) / dp(500))
+        self._large_scale.xyz = scale, scale, 1
+        self._large_color.rgba = self.title_color[:3] + [self.title_color[3] * (1 - progress)]
+        self._inline_color.rgba = self.title_color[:3] + [self.title_color[3] * max(0, progress - 0.7) / 0.3]
+        self._collapse = progress * self.large_title_height if self.large_title else 0
+        self.invalidate_backdrop()
+
+
+class CupertinoToolbar(_CupertinoBar):
     """
     iOS style Toolbar. :class:`CupertinoToolbar`
     is a :class:`~kivy.uix.relativelayout.RelativeLayout` and can accept any number of widgets
@@ -243,6 +553,16 @@ class CupertinoTabBar(CupertinoToolbar):
            background_color: 0.5, 0, 0, 1
     """
 
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoTabBar`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoTabBar`
+        """
+
+        self._selection = SelectionGroup()
+        super().__init__(**kwargs)
+
     def add_widget(self, widget, index=0, canvas=None):
         """
         Add an instance of :class:`CupertinoTab` to :class:`CupertinoTabBar`
@@ -250,6 +570,7 @@ class CupertinoTabBar(CupertinoToolbar):
 
         if len(self.children) >= 1:
             assert isinstance(widget, CupertinoTab), 'CupertinoTabBar accepts only CupertinoTab widget'
+            widget.group = self._selection
             self._tabs.add_widget(widget)
             if widget.selected or len(self._tabs.children) == 1:
                 widget.refresh()
@@ -263,6 +584,121 @@ class CupertinoTabBar(CupertinoToolbar):
         :return: The selected :class:`CupertinoTab`
         """
         
-        for tab in self._tabs.children:
-            if tab.selected:
-                return tab
+        return self._selection.selected
+
+
+class CupertinoTabController(BoxLayout):
+    """
+    A :class:`CupertinoTabBar` that shows a view for each of its tabs. The view of a tab is built when the tab is
+    first selected, and the views of recently selected tabs are kept, so that switching back to them is instant.
+    Views of tabs that are not selected are removed from the widget tree, so they are not drawn or laid out
+
+    **Python**
+
+    .. code-block:: python
+
+       tabs = CupertinoTabController(max_tabs=3)
+       tabs.add_tab(CupertinoTab(text='Mail', symbol='envelope'), MailboxesView)
+       tabs.add_tab(CupertinoTab(text='Settings', symbol='gear'), SettingsView)
+    """
+
+    max_tabs = NumericProperty(0)
+    """
+    Maximum number of views of tabs that are kept, or ``0`` to keep all of them. The views of the least recently
+    selected tabs are removed first. Before a view is removed, the value returned by its ``save_state()`` method (if it
+    has one) is kept and passed to the ``restore_state(state)`` method of the view when it is built again
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoTabController(max_tabs=3)
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoTabController:
+           max_tabs: 3
+    """
+
+    current_tab = ObjectProperty(None, allownone=True)
+    """
+    The selected :class:`CupertinoTab` of :class:`CupertinoTabController`
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoTabController`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoTabController`
+        """
+
+        self._factories = {}
+        self._states = {}
+        self._views = {}
+        super().__init__(**kwargs)
+        self.bind(max_tabs=lambda *args: self._evict())
+
+    def add_tab(self, tab, factory):
+        """
+        Add a tab to :class:`CupertinoTabController`
+
+        :param tab: Instance of :class:`CupertinoTab`
+        :param factory: Callable taking no arguments that returns the view of :param tab:
+        """
+
+        self._factories[tab] = factory
+        tab.bind(on_chosen=self._select_tab)
+        self._tab_bar.add_widget(tab)
+
+    def get_view(self, tab):
+        """
+        Get the view of a tab of :class:`CupertinoTabController` if it is built
+
+        :param tab: Instance of :class:`CupertinoTab`
+        :return: The view, or ``None`` if it is not built
+        """
+
+        return self._views.get(tab)
+
+    def _select_tab(self, tab):
+        """
+        Callback when a tab of :class:`CupertinoTabController` is selected, showing its view
+
+        :param tab: Selected :class:`CupertinoTab`
+        """
+
+        if tab is self.current_tab:
+            return
+
+        # Views are kept in the order their tabs were selected, so the first view is the least recently used
+        view = self._views.pop(tab, None)
+        if view is None:
+            view = self._factories[tab]()
+            state = self._states.pop(tab, None)
+            if state is not None and hasattr(view, 'restore_state'):
+                view.restore_state(state)
+        self._views[tab] = view
+
+        if self.current_tab is not None and self.current_tab in self._views:
+            self._content.remove_widget(self._views[self.current_tab])
+        self._content.add_widget(view)
+        self.current_tab = tab
+        self._evict()
+
+    def _evict(self):
+        """
+        Remove the views of the least recently selected tabs until at most :attr:`max_tabs` are kept
+        """
+
+        if not self.max_tabs:
+            return
+        for tab in list(self._views):
+            if len(self._views) <= self.max_tabs:
+                break
+            if tab is self.current_tab:
+                continue
+            view = self._views.pop(tab)
+            if hasattr(view, 'save_state'):
+                self._states[tab] = view.save_state()
@@ -6,14 +6,16 @@ Behaviors allow for expanded functionality for existing widgets
 """
 
 from kivy.uix.behaviors import ButtonBehavior
-from kivy.properties import NumericProperty, BooleanProperty, ColorProperty
+from kivy.event import EventDispatcher
+from kivy.properties import NumericProperty, BooleanProperty, ColorProperty, ObjectProperty
 from kivy.animation import Animation
 from kivy.clock import Clock
 
 __all__ = [
     'CupertinoButtonBehavior',
     'LongPressBehavior',
-    'SelectableBehavior'
+    'SelectableBehavior',
+    'SelectionGroup'
 ]
 
 
@@ -236,9 +238,129 @@ class LongPressBehavior:
         """
 
 
+class SelectionGroup(EventDispatcher):
+    """
+    A group of widgets with :class:`SelectableBehavior` of which at most one is selected. Selecting a widget only
+    deselects the widget that was selected before it, and the widgets of a group can have different parents
+
+    **Python**
+
+    .. code-block:: python
+
+       group = SelectionGroup()
+       for cell, option in zip(cells, options):
+           cell.add_widget(RadioOption(text=option, group=group))
+    """
+
+    selected = ObjectProperty(None, allownone=True)
+    """
+    Selected widget of :class:`SelectionGroup`, or ``None`` if no widget is selected
+    """
+
+    selected_index = NumericProperty(-1)
+    """
+    Index of the selected widget of :class:`SelectionGroup` in :attr:`items`, or ``-1`` if no widget is selected
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`SelectionGroup`
+
+        :param kwargs: Keyword arguments for :class:`SelectionGroup`
+        """
+
+        self._items = []
+        self._indices = {}
+        super().__init__(**kwargs)
+
+    @property
+    def items(self):
+        """
+        Widgets of :class:`SelectionGroup`, in the order they were added
+        """
+
+        return tuple(self._items)
+
+    @classmethod
+    def for_parent(cls, parent):
+        """
+        Get the group of the widgets with :class:`SelectableBehavior` in a parent that are not given a group
+
+        :param parent: The parent
+        :return: Instance of :class:`SelectionGroup`
+        """
+
+        group = getattr(parent, '_selection_group', None)
+        if group is None:
+            group = parent._selection_group = cls()
+        return group
+
+    def add(self, item):
+        """
+        Add a widget to :class:`SelectionGroup`, selecting it if it is selected
+
+        :param item: Widget with :class:`SelectableBehavior`
+        """
+
+        if item in self._indices:
+            return
+        self._indices[item] = len(self._items)
+        self._items.append(item)
+        if item.selected:
+            self.select(item)
+
+    def remove(self, item):
+        """
+        Remove a widget from :class:`SelectionGroup`
+
+        :param item: Widget with :class:`SelectableBehavior`
+        """
+
+        index = self._indices.pop(item, None)
+        if index is None:
+            return
+        del self._items[index]
+        for i in range(index, len(self._items)):
+            self._indices[self._items[i]] = i
+        if self.selected is item:
+            self.selected = None
+        self.selected_index = -1 if self.selected is None else self._indices[self.selected]
+
+    def select(self, item):
+        """
+        Select a widget of :class:`SelectionGroup`, deselecting the widget selected before it. The ``on_chosen`` event
+        of the widget is dispatched if it was not selected in :class:`SelectionGroup`
+
+        :param item: Widget with :class:`SelectableBehavior`
+        """
+
+        previous = self.selected
+        self.selected = item
+        self.selected_index = self._indices[item]
+        item.selected = True
+        if previous is item:
+            return
+        if previous is not None:
+            previous.selected = False
+        item.dispatch('on_chosen')
+
+    def deselect(self, item):
+        """
+        Deselect a widget of :class:`SelectionGroup` if it is selected
+
+        :param item: Widget with :class:`SelectableBehavior`
+        """
+
+        if self.selected is item:
+            self.selected = None
+            self.selected_index = -1
+            item.selected = False
+
+
 class SelectableBehavior:
     """
-    Behavior to detect a selection of a specific widget among all other widgets in :attr:`parent`
+    Behavior to detect a selection of a specific widget among all other widgets in its :attr:`group`, or in
+    :attr:`parent` if it has no group
 
     .. image:: ../_static/segmented_controls/demo.gif
     """
@@ -263,6 +385,25 @@ class SelectableBehavior:
            selected: True
     """
 
+    group = ObjectProperty(None, allownone=True)
+    """
+    Instance of :class:`SelectionGroup` of a widget, or ``None`` to group it with the other widgets in its
+    :attr:`parent`
+
+    **Python**
+
+    .. code-block:: python
+
+       ExampleWidget(group=group)
+
+    **KV**
+
+    .. code-block::
+
+       ExampleWidget:
+           group: app.group
+    """
+
     def __init__(self, **kwargs):
         """
         Initialize behaviors of :class:`SelectableBehavior`
@@ -270,8 +411,30 @@ class SelectableBehavior:
         :param kwargs: Keyword arguments for :class:`SelectableBehavior`
         """
 
+        self._group = None
         super().__init__(**kwargs)
         self.register_event_type('on_chosen')
+        self.bind(parent=self._update_group, group=self._update_group)
+        self._update_group()
+
+    def _update_group(self, *args):
+        """
+        Callback when :attr:`group` or :attr:`parent` of a widget with :class:`SelectableBehavior` is changed, moving
+        it to its group
+
+        :param args: Arguments of the callback
+        """
+
+        group = self.group
+        if group is None and self.parent is not None:
+            group = SelectionGroup.for_parent(self.parent)
+        if group is self._group:
+            return
+        if self._group is not None:
+            self._group.remove(self)
+        self._group = group
+        if group is not None:
+            group.add(self)
 
     def on_touch_up(self, touch):
         """
@@ -292,16 +455,18 @@ class SelectableBehavior:
         :param value: Value of :attr:`selected`
         """
 
-        if self.parent is not None and value:
-            self.dispatch('on_chosen')
-            for child in self.parent.children:
-                if child is not self and isinstance(child, SelectableBehavior):
-                    child.selected = False
+        if self._group is None:
+            return
+        if value:
+            if self._group.selected is not self:
+                self._group.select(self)
+        else:
+            self._group.deselect(self)
 
     def refresh(self):
         """
         Set :attr:`selected` of this instance of :class:`SelectableBehavior` to ``True`` while setting all other
-        instances in :attr:`parent` to ``False``
+        instances in its group to ``False``
 
         .. note::
            This function is mainly to be used when adding widgets to a parent. Otherwise, setting :attr:`selected`
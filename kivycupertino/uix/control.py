@@ -2,12 +2,14 @@
 Controls allow users to control information on their screen
 """
 
+from bisect import bisect_right
 from kivycupertino.uix.label import CupertinoLabel
-from kivycupertino.uix.behavior import SelectableBehavior
+from kivycupertino.uix.behavior import SelectableBehavior, SelectionGroup
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.relativelayout import RelativeLayout
 from kivy.properties import ColorProperty, NumericProperty, BooleanProperty
 from kivy.animation import Animation
+from kivy.clock import Clock
 from kivy.lang.builder import Builder
 
 __all__ = [
@@ -25,9 +27,7 @@ Builder.load_string("""
     _selected_segment: selected_segment
     
     on_touch_down: if self.collide_point(*args[1].pos): args[1].grab(self)
-    on_touch_up:
-        self._select(self.get_selected_segment(), self.transition_duration)
-        if args[1].grab_current is self: args[1].ungrab(self)
+    on_touch_up: if args[1].grab_current is self: args[1].ungrab(self)
 
     canvas.before:
         Color:
@@ -185,24 +185,29 @@ class CupertinoSegmentedControls(RelativeLayout):
         :param kwargs: Keyword arguments for :class:`CupertinoSegmentedControls`
         """
 
+        self._selection = SelectionGroup()
+        self._edges = None
+        self._trigger_snap = Clock.create_trigger(self._snap, -1)
         super().__init__(**kwargs)
-        def resize(*args): self._select(self.get_selected_segment(), 0)
-        self.bind(size=resize, pos=resize)
+        self._selection.bind(selected=lambda instance, segment: self._select(segment, self.transition_duration))
+        self._segments.bind(children=self._on_segments_layout)
 
     def _select(self, segment, duration):
         """
         Show selection animation to select a segment of :class:`CupertinoSegmentedControls`
 
         :param segment: Segment of :class:`CupertinoSegmentedControls` to be selected
+        :param duration: Duration of the animation, or ``0`` to move the selection without an animation
         """
 
-        segment.selected = True
-        animation = Animation(
-            size=segment.size,
-            pos=segment.pos,
-            duration=duration
-        )
-        animation.start(self._selected_segment)
+        if segment is None:
+            return
+        Animation.cancel_all(self._selected_segment, 'size', 'pos')
+        if duration:
+            Animation(size=segment.size, pos=segment.pos, duration=duration).start(self._selected_segment)
+        else:
+            self._selected_segment.size = segment.size
+            self._selected_segment.pos = segment.pos
 
     def on_touch_move(self, touch):
         """
@@ -211,10 +216,48 @@ class CupertinoSegmentedControls(RelativeLayout):
         :param touch: Touch on :class:`CupertinoSegmentedControls`
         """
 
-        for segment in self._segments.children:
-            if touch.grab_current is self and segment.x <= self.to_local(*touch.pos)[0] <= segment.x + segment.width:
-                self._select(segment, self.transition_duration)
-                break
+        if touch.grab_current is not self:
+            return
+        segment = self._get_segment_at(self.to_local(*touch.pos)[0])
+        if segment is not None:
+            segment.selected = True
+
+    def _on_segments_layout(self, *args):
+        """
+        Callback when the segments of :class:`CupertinoSegmentedControls` are added, removed or laid out, moving the
+        selection onto the selected segment without an animation at most once per frame
+
+        :param args: Arguments of the callback
+        """
+
+        self._edges = None
+        self._trigger_snap()
+
+    def _snap(self, *args):
+        """
+        Move the selection of :class:`CupertinoSegmentedControls` onto the selected segment without an animation
+
+        :param args: Arguments of the callback
+        """
+
+        self._select(self.get_selected_segment(), 0)
+
+    def _get_segment_at(self, x):
+        """
+        Get the segment of :class:`CupertinoSegmentedControls` at a horizontal position
+
+        :param x: Horizontal position relative to :class:`CupertinoSegmentedControls`
+        :return: The :class:`CupertinoSegment` at :param x:, or ``None`` if there is none
+        """
+
+        # The left edges of the segments are kept in order until they are laid out again, so they can be bisected
+        if self._edges is None:
+            segments = self._segments.children[::-1]
+            self._edges = [segment.x for segment in segments], segments
+        lefts, segments = self._edges
+        index = bisect_right(lefts, x) - 1
+        if index >= 0 and x <= segments[index].right:
+            return segments[index]
 
     def add_widget(self, widget, index=0, canvas=None):
         """
@@ -224,6 +267,8 @@ class CupertinoSegmentedControls(RelativeLayout):
         if len(self.children) >= 2:
             assert isinstance(widget,
                               CupertinoSegment), 'CupertinoSegmentedControls accepts only CupertinoSegment widget'
+            widget.group = self._selection
+            widget.bind(pos=self._on_segments_layout, size=self._on_segments_layout)
             self._segments.add_widget(widget, index)
             if widget.selected or len(self._segments.children) == 1:
                 widget.refresh()
@@ -237,9 +282,7 @@ class CupertinoSegmentedControls(RelativeLayout):
         :return: The selected :class:`CupertinoSegment`
         """
 
-        for segment in self._segments.children:
-            if segment.selected:
-                return segment
+        return self._selection.selected
 
 
 class CupertinoStepper(BoxLayout):
@@ -0,0 +1,169 @@
+"""
+Gestures estimate how fast and where a touch is moving so that widgets can respond to flicks
+"""
+
+__all__ = [
+    'VelocityTracker'
+]
+
+
+class VelocityTracker:
+    """
+    Tracker of the velocity of a touch from its most recent positions, kept in a fixed-size ring buffer so that
+    adding a position does not allocate memory
+
+    **Python**
+
+    .. code-block:: python
+
+       tracker = VelocityTracker()
+
+       def on_touch_down(touch):
+           tracker.reset()
+           tracker.add_touch(touch)
+
+       def on_touch_move(touch):
+           tracker.add_touch(touch)
+
+       def on_touch_up(touch):
+           tracker.add_touch(touch)
+           resting_x = tracker.project(touch.x, tracker.velocity_x())
+    """
+
+    deceleration_rate = 0.998
+    """
+    Fraction of velocity kept after each millisecond of deceleration, used by :meth:`project`
+    """
+
+    def __init__(self, size=10, horizon=0.1):
+        """
+        Initialize variables of :class:`VelocityTracker`
+
+        :param size: Maximum number of positions kept
+        :param horizon: Age in seconds after which positions are ignored when computing velocity
+        """
+
+        self.size = size
+        self.horizon = horizon
+        self._x = [0.0] * size
+        self._y = [0.0] * size
+        self._times = [0.0] * size
+        self._index = 0
+        self._count = 0
+
+    def reset(self):
+        """
+        Forget all positions added to :class:`VelocityTracker`
+        """
+
+        self._index = 0
+        self._count = 0
+
+    def add(self, x, y, time):
+        """
+        Add a position to :class:`VelocityTracker`, replacing the oldest one if :attr:`size` positions are kept
+
+        :param x: Horizontal component of the position
+        :param y: Vertical component of the position
+        :param time: Time in seconds at which the touch was at the position
+        """
+
+        index = self._index
+        self._x[index] = x
+        self._y[index] = y
+        self._times[index] = time
+        self._index = (index + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+
+    def add_touch(self, touch):
+        """
+        Add the current position of a touch to :class:`VelocityTracker`
+
+        :param touch: Touch to add
+        """
+
+        self.add(touch.x, touch.y, touch.time_update)
+
+    def _velocity(self, values):
+        """
+        Compute the velocity of a component of the positions with a least squares fit of the recent positions
+
+        :param values: Ring buffer of the component
+        :return: Velocity in units per second
+        """
+
+        count = self._count
+        if count < 2:
+            return 0
+
+        size = self.size
+        times = self._times
+        newest = (self._index - 1) % size
+        latest_time = times[newest]
+        n = 0
+        sum_t = sum_v = sum_tt = sum_tv = 0
+        for offset in range(count):
+            index = (newest - offset) % size
+            t = times[index] - latest_time
+            if t < -self.horizon:
+                break
+            v = values[index]
+            n += 1
+            sum_t += t
+            sum_v += v
+            sum_tt += t * t
+            sum_tv += t * v
+
+        denominator = n * sum_tt - sum_t * sum_t
+        if n < 2 or denominator <= 0:
+            return 0
+        return (n * sum_tv - sum_t * sum_v) / denominator
+
+    def velocity_x(self):
+        """
+        Compute the horizontal velocity of the touch
+
+        :return: Horizontal velocity in pixels per second
+        """
+
+        return self._velocity(self._x)
+
+    def velocity_y(self):
+        """
+        Compute the vertical velocity of the touch
+
+        :return: Vertical velocity in pixels per second
+        """
+
+        return self._velocity(self._y)
+
+    @classmethod
+    def project(cls, position, velocity):
+        """
+        Compute where a component of the position of a touch would come to rest if it kept decelerating
+        at :attr:`deceleration_rate` after being released
+
+        :param position: Component of the position when released
+        :param velocity: Velocity of the component when released, in pixels per second
+        :return: Component of the resting position
+        """
+
+        rate = cls.deceleration_rate
+        return position + velocity / 1000 * rate / (1 - rate)
+
+    @staticmethod
+    def duration(distance, velocity, maximum):
+        """
+        Compute the duration of an ``'out_quad'`` animation over a distance that starts at a velocity, so that
+        content keeps moving at the speed it was released at
+
+        :param distance: Distance to animate over
+        :param velocity: Velocity when released, in pixels per second
+        :param maximum: Duration to use when :param velocity: is too slow or moving away from the target
+        :return: Duration of the animation in seconds
+        """
+
+        if distance * velocity <= 0:
+            return maximum
+        return min(maximum, 2 * distance / velocity)
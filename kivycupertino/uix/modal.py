@@ -2,19 +2,32 @@
 Modals help alert users to information
 """
 
-from kivy.properties import NumericProperty, StringProperty, ColorProperty, BooleanProperty, ListProperty
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from kivy.properties import NumericProperty, StringProperty, ColorProperty, BooleanProperty, ListProperty, \
+    ObjectProperty, OptionProperty
+from kivy.event import EventDispatcher
+from kivy.graphics import PushMatrix, PopMatrix, Scale, Translate
+from kivy.animation import Animation, AnimationTransition
 from kivy.uix.widget import Widget
 from kivy.uix.modalview import ModalView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivycupertino.uix.label import CupertinoLabel
 from kivycupertino.uix.button import CupertinoButton
+from kivycupertino.uix.backdrop import CupertinoBackdrop
 from kivy.core.window import Window
+from kivy.clock import Clock
 from kivy.lang.builder import Builder
 from kivy.metrics import dp
 
 __all__ = [
     'CupertinoDialog',
     'CupertinoActionSheet',
-    'CupertinoModalButton'
+    'CupertinoModalButton',
+    'CupertinoModalPool',
+    'CupertinoAlertQueue'
 ]
 
 Builder.load_string("""
@@ -30,12 +43,21 @@ Builder.load_string("""
             pos: self.pos
 
 <_CupertinoModal>:
+    canvas.before:
+        Color:
+            rgba: 1, 1, 1, self._anim_alpha if self._backdrop_texture else 0
+        Rectangle:
+            texture: self._backdrop_texture
+            size: self._window.size if self._window and self._backdrop_texture else (0, 0)
+
     background: root_path + 'transparent.png'
     overlay_color: 0, 0, 0, 0.45
     auto_dismiss: False
+    _anim_duration: 0.2
 
 <CupertinoDialog>:
     _content: content
+    _message_frame: message_frame
     _actions: actions
     _instantiated: isinstance(root._actions, BoxLayout) and bool(root._actions.children)
     
@@ -53,6 +75,15 @@ Builder.load_string("""
                     radius: (dp(root.curve), dp(root.curve), 0, 0) if root._instantiated else (dp(root.curve),) * 4 
                     size: self.size
                     pos: 0, 0
+            
+            GridLayout:
+                id: message_frame
+                cols: 1
+                padding: dp(15), dp(20), dp(15), dp(15)
+                spacing: dp(5)
+                size_hint_y: None
+                height: self.minimum_height if self.children else 0
+                pos_hint: {'top': 1}
         _Separator:
             size_hint_y: None
             height: dp(root.spacing) if root._instantiated else 0
@@ -61,6 +92,24 @@ Builder.load_string("""
             orientation: 'horizontal'
             size_hint_y: None
 
+<_ActionSheetList>:
+    bar_width: 0
+    
+    RecycleBoxLayout:
+        orientation: 'vertical'
+        size_hint_y: None
+        height: self.minimum_height
+        default_size: None, root.action_height
+        default_size_hint: 1, None
+
+<_ActionSheetRow>:
+    canvas.after:
+        Color:
+            rgb: 0.8, 0.8, 0.8
+        Rectangle:
+            size: self.width, self.separator_height
+            pos: self.x, self.top - self.separator_height
+
 <_ActionSheetLabel>:
     halign: 'center'
     font_size: '11sp'
@@ -138,6 +187,326 @@ class _CupertinoModal(ModalView):
     Base class for iOS style modals with separate content and actions
     """
 
+    blur_radius = NumericProperty(0)
+    """
+    Distance in pixels that the content behind a modal is blurred over when the modal is open (``0`` to not blur).
+    The blurred content is rendered once when the modal opens and then reused, so :meth:`invalidate_backdrop` should
+    be called if the content behind the modal changes while it is open
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoDialog(blur_radius=20)
+   
+    **KV**
+    
+    .. code-block::
+    
+       CupertinoDialog:
+           blur_radius: 20
+    """
+
+    presentation = OptionProperty('transform', options=['transform', 'fade'])
+    """
+    How a modal is animated when it opens and is dismissed. ``'transform'`` lays the modal out once at its final size
+    and only animates a :class:`~kivy.graphics.Scale` or :class:`~kivy.graphics.Translate` of its content, while
+    ``'fade'`` only fades the overlay behind the modal in and out
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoDialog(presentation='fade')
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoDialog:
+           presentation: 'fade'
+    """
+
+    _backdrop_texture = ObjectProperty(None, allownone=True)
+    """
+    Texture of the blurred content behind a modal
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`_CupertinoModal`
+
+        :param kwargs: Keyword arguments for :class:`_CupertinoModal`
+        """
+
+        self._batching = False
+        self._separators = []
+        self._backdrop = None
+        self._presented = None
+        self._trigger_backdrop = Clock.create_trigger(self._render_backdrop)
+        super().__init__(**kwargs)
+        self.bind(
+            on_pre_open=lambda *args: self._render_backdrop(),
+            _is_open=self._on_open_changed,
+            blur_radius=lambda *args: self.invalidate_backdrop()
+        )
+
+        # The transform wraps the canvas of the content only, so the overlay and backdrop stay in place
+        self._presented = self.children[-1]
+        self._presentation_translate = Translate()
+        self._presentation_scale = Scale()
+        self._presented.canvas.before.insert(0, self._presentation_scale)
+        self._presented.canvas.before.insert(0, self._presentation_translate)
+        self._presented.canvas.before.insert(0, PushMatrix())
+        self._presented.canvas.after.add(PopMatrix())
+        self._present(self._anim_alpha if self.presentation == 'transform' else 1)
+
+    def on_presentation(self, instance, value):
+        """
+        Callback when :attr:`presentation` is changed
+
+        :param instance: Instance of :class:`_CupertinoModal`
+        :param value: New value of :attr:`presentation`
+        """
+
+        if self._presented is not None:
+            self._present(self._anim_alpha if value == 'transform' else 1)
+
+    def on__anim_alpha(self, instance, value):
+        """
+        Callback when a modal is animated while it opens or is dismissed
+
+        :param instance: Instance of :class:`_CupertinoModal`
+        :param value: Progress of the animation, from ``0`` when dismissed to ``1`` when open
+        """
+
+        if self.presentation == 'transform' and self._presented is not None:
+            self._present(AnimationTransition.out_cubic(value))
+        super().on__anim_alpha(instance, value)
+
+    def _present(self, progress):
+        """
+        Transform the content of a modal without changing its layout, fading it by default
+
+        :param progress: Progress of the presentation, from ``0`` when dismissed to ``1`` when open
+        """
+
+        self._presented.opacity = progress
+
+    def on_touch_down(self, touch):
+        """
+        Ignore touches while a modal is being animated by its presentation
+
+        :param touch: Touch on :class:`_CupertinoModal`
+        """
+
+        if self.presentation == 'transform' and self._anim_alpha < 1:
+            return True
+        return super().on_touch_down(touch)
+
+    def _on_open_changed(self, instance, is_open):
+        """
+        Callback when a modal is opened or completely dismissed
+
+        :param instance: Instance of :class:`_CupertinoModal`
+        :param is_open: If the modal is open
+        """
+
+        if is_open:
+            Window.bind(size=self._trigger_backdrop)
+        else:
+            Window.unbind(size=self._trigger_backdrop)
+            self._trigger_backdrop.cancel()
+
+    def open(self, *args, **kwargs):
+        """
+        Open a modal, stopping animations left over from dismissing it while it was opening
+
+        :param args: Arguments of the callback
+        :param kwargs: Keyword arguments for :meth:`~kivy.uix.modalview.ModalView.open`
+        """
+
+        if not self._is_open:
+            Animation.cancel_all(self, '_anim_alpha')
+        super().open(*args, **kwargs)
+
+    def _render_backdrop(self, *args):
+        """
+        Render the blurred content behind a modal if :attr:`blur_radius` is set
+
+        :param args: Arguments of the callback
+        """
+
+        if not self.blur_radius:
+            self._backdrop_texture = None
+            return
+        if self._backdrop is None:
+            self._backdrop = CupertinoBackdrop()
+
+        window = self._window or Window
+        children = window.children
+        below = children[children.index(self) + 1:] if self in children else children
+        self._backdrop.blur_radius = self.blur_radius
+        self._backdrop.render(below[::-1], 0, 0, window.width, window.height, window.clearcolor)
+        self._backdrop_texture = self._backdrop.texture
+
+    def invalidate_backdrop(self):
+        """
+        Render the blurred content behind a modal again on the next frame, for example when the content is animated
+        """
+
+        if self._is_open:
+            self._trigger_backdrop()
+
+    def _get_action_buttons(self):
+        """
+        Get the widgets of the actions of :class:`_CupertinoModal` that dispatch ``on_release``
+
+        :return: List of the widgets
+        """
+
+        return [child for child in self._actions.children if isinstance(child, CupertinoModalButton)]
+
+    async def present(self, animation=True):
+        """
+        Open a modal and wait until one of its actions is released or it is dismissed. The modal is dismissed once
+        an action is released, if the action does not dismiss it. Requires a running :mod:`asyncio` event loop, such as
+        the one of :class:`~kivycupertino.app.CupertinoApp` with :attr:`~kivycupertino.app.CupertinoApp.use_asyncio`
+        set to ``True``
+
+        **Python**
+
+        .. code-block:: python
+
+           async def delete_message():
+               dialog = CupertinoDialog(title='Delete Message?')
+               dialog.add_widget(CupertinoModalButton(text='Cancel'))
+               dialog.add_widget(CupertinoModalButton(text='Delete', text_color=(1, 0, 0, 1)))
+
+               action = await dialog.present()
+               if action is not None and action.text == 'Delete':
+                   await delete()
+
+        :param animation: If the modal should be animated when it opens and is dismissed
+        :return: Instance of :class:`CupertinoModalButton` released (or dictionary of the action released in a
+            scrollable list of :class:`CupertinoActionSheet`), or ``None`` if the modal was dismissed without an action
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        dismissing = []
+
+        def on_release(instance, *args):
+            if not future.done():
+                future.set_result(args[0] if args else instance)
+
+        def on_open_changed(instance, is_open):
+            if not is_open and not future.done():
+                future.set_result(None)
+
+        def on_pre_dismiss(instance):
+            dismissing.append(True)
+
+        # Callbacks bound last are called first, so the action is chosen before callbacks of the action dismiss
+        sources = self._get_action_buttons()
+        for source in sources:
+            source.bind(on_release=on_release)
+        self.bind(_is_open=on_open_changed, on_pre_dismiss=on_pre_dismiss)
+        self.open(animation=animation)
+        try:
+            return await future
+        finally:
+            for source in sources:
+                source.unbind(on_release=on_release)
+            self.unbind(_is_open=on_open_changed, on_pre_dismiss=on_pre_dismiss)
+            if self._is_open and not dismissing:
+                self.dismiss(animation=animation)
+
+    def _get_separator(self, **properties):
+        """
+        Get an instance of :class:`_Separator`, reusing one that was removed if possible
+
+        :param properties: Properties to set on the separator
+        :return: The separator
+        """
+
+        separator = self._separators.pop() if self._separators else _Separator()
+        for name, value in properties.items():
+            setattr(separator, name, value)
+        return separator
+
+    def _remove_actions(self, children):
+        """
+        Remove widgets from the actions of :class:`_CupertinoModal`, keeping removed separators for reuse
+
+        :param children: List of instances of :class:`Widget` to remove
+        """
+
+        for child in children:
+            self._actions.remove_widget(child)
+            if isinstance(child, _Separator):
+                self._separators.append(child)
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager to add or remove several actions of :class:`_CupertinoModal` while only updating its shape
+        once, at the end
+
+        **Python**
+
+        .. code-block:: python
+
+           with dialog.batch():
+               dialog.add_widget(CupertinoModalButton(text='Yes'))
+               dialog.add_widget(CupertinoModalButton(text='No'))
+        """
+
+        batching = self._batching
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = batching
+            if not batching:
+                self._configure_shape()
+
+    def set_actions(self, actions):
+        """
+        Replace all instances of :class:`CupertinoModalButton` of :class:`_CupertinoModal`, updating its shape once
+
+        **Python**
+
+        .. code-block:: python
+
+           dialog.set_actions([CupertinoModalButton(text='Yes'), CupertinoModalButton(text='No')])
+
+        :param actions: List of instances of :class:`CupertinoModalButton` (or dictionaries of their properties, where
+            the ``'on_release'`` key can be a callback when released) in the order they should be shown
+        """
+
+        with self.batch():
+            self._remove_actions(self._actions.children[:])
+            for action in actions:
+                self.add_widget(self._build_action(action))
+
+    @staticmethod
+    def _build_action(action):
+        """
+        Build an instance of :class:`CupertinoModalButton` from a dictionary of its properties
+
+        :param action: Instance of :class:`CupertinoModalButton`, or dictionary of its properties where the
+            ``'on_release'`` key can be a callback when it is released
+        :return: Instance of :class:`CupertinoModalButton`
+        """
+
+        if not isinstance(action, dict):
+            return action
+
+        button = CupertinoModalButton(**{name: value for name, value in action.items() if name != 'on_release'})
+        if action.get('on_release') is not None:
+            button.bind(on_release=action['on_release'])
+        return button
+
     def remove_widget(self, widget):
         """
         Remove an instance of :class:`CupertinoModalButton` from instance of :class:`_CupertinoModal`
@@ -147,7 +516,7 @@ class _CupertinoModal(ModalView):
 
         index = self._actions.children.index(widget)
         if index != len(self._actions.children) - 1:
-            self._actions.remove_widget(self._actions.children[index + 1])
+            self._remove_actions([self._actions.children[index + 1]])
         self._actions.remove_widget(widget)
         self._configure_shape()
 
@@ -159,7 +528,7 @@ class _CupertinoModal(ModalView):
         :param children: List of instances of :class:`Widget` to be removed from :class:`_CupertinoModal` (Optional)
         """
 
-        self._actions.clear_widgets(children)
+        self._remove_actions(self._actions.children[:] if children is None else children)
         self._configure_shape()
 
 
@@ -250,17 +619,84 @@ class CupertinoDialog(_CupertinoModal):
            curve: 20
     """
 
+    title = StringProperty(' ')
+    """
+    Title shown at the top of :class:`CupertinoDialog`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoDialog(title='Hello World')
+   
+    **KV**
+    
+    .. code-block::
+    
+       CupertinoDialog:
+           title: 'Hello World'
+    """
+
+    message = StringProperty(' ')
+    """
+    Message shown below :attr:`title` of :class:`CupertinoDialog`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoDialog(message='Hello World')
+   
+    **KV**
+    
+    .. code-block::
+    
+       CupertinoDialog:
+           message: 'Hello World'
+    """
+
+    text_color = ColorProperty([0, 0, 0, 1])
+    """
+    Color of :attr:`title` and :attr:`message` of :class:`CupertinoDialog`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoDialog(text_color=(1, 0, 0, 1))
+   
+    **KV**
+    
+    .. code-block::
+    
+       CupertinoDialog:
+           text_color: 1, 0, 0, 1
+    """
+
     def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoDialog`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoDialog`
+        """
+
+        self._title_label = _ActionSheetLabel(bold=True, font_size='15sp')
+        self._message_label = _ActionSheetLabel(font_size='12sp')
         super().__init__(**kwargs)
         self._content.height = (Window.height * self.size_hint_y) if self.size_hint_y is not None else self.height
         self.size_hint_y = None
+        self._title_label.color = self._message_label.color = self.text_color
         self.bind(action_height=lambda *args: self._configure_shape())
+        self.on_title(self, self.title)
+        self.on_message(self, self.message)
 
     def _configure_shape(self):
         """
         Update size of :class:`CupertinoDialog` and the orientation of its actions
         """
 
+        if self._batching:
+            return
         if self._actions.children:
             longest_text = len(self._actions.children[0].text)
             for child in self._actions.children:
@@ -289,6 +725,61 @@ class CupertinoDialog(_CupertinoModal):
 
             self.height = self._content.height + self._actions.height
 
+    def _present(self, progress):
+        """
+        Zoom :class:`CupertinoDialog` in from a larger size while fading it in
+
+        :param progress: Progress of the presentation, from ``0`` when dismissed to ``1`` when open
+        """
+
+        scale = 1 + 0.15 * (1 - progress)
+        self._presentation_scale.xyz = scale, scale, 1
+        self._presentation_scale.origin = self.center
+        self._presented.opacity = progress
+
+    def on_text_color(self, instance, value):
+        """
+        Callback when :attr:`text_color` is changed
+
+        :param instance: Instance of :class:`CupertinoDialog`
+        :param value: New value of :attr:`text_color`
+        """
+
+        self._title_label.color = value
+        self._message_label.color = value
+
+    def on_title(self, instance, value):
+        """
+        Callback when :attr:`title` is changed
+
+        :param instance: Instance of :class:`CupertinoDialog`
+        :param value: New value of :attr:`title`
+        """
+
+        self._title_label.text = value
+        if getattr(self, '_message_frame', None) is None:
+            return
+        if value.strip() and self._title_label.parent is None:
+            self._message_frame.add_widget(self._title_label, len(self._message_frame.children))
+        elif not value.strip() and self._title_label.parent is not None:
+            self._message_frame.remove_widget(self._title_label)
+
+    def on_message(self, instance, value):
+        """
+        Callback when :attr:`message` is changed
+
+        :param instance: Instance of :class:`CupertinoDialog`
+        :param value: New value of :attr:`message`
+        """
+
+        self._message_label.text = value
+        if getattr(self, '_message_frame', None) is None:
+            return
+        if value.strip() and self._message_label.parent is None:
+            self._message_frame.add_widget(self._message_label)
+        elif not value.strip() and self._message_label.parent is not None:
+            self._message_frame.remove_widget(self._message_label)
+
     def on_size_hint_y(self, instance, value):
         """
         Set value of :attr:`size_hint_y` without affecting :attr:`_og_size_hint_y`
@@ -316,7 +807,7 @@ class CupertinoDialog(_CupertinoModal):
             if isinstance(widget, CupertinoModalButton):
                 self._actions.add_widget(widget, index)
                 if len(self._actions.children) > 1:
-                    self._actions.add_widget(_Separator(size_hint=(None, None), size=(0, 0)), index + 1)
+                    self._actions.add_widget(self._get_separator(size_hint=(None, None), size=(0, 0)), index + 1)
                 self._configure_shape()
             else:
                 self._content.add_widget(widget, index)
@@ -342,7 +833,10 @@ class CupertinoDialog(_CupertinoModal):
         :param children: List of instances of :class:`Widget` to be removed from :class:`CupertinoDialog` (Optional)
         """
 
-        self._content.clear_widgets(children)
+        content = children
+        if content is None:
+            content = [child for child in self._content.children if child is not self._message_frame]
+        self._content.clear_widgets(content)
         super().clear_widgets(children)
 
 
@@ -499,6 +993,25 @@ class CupertinoActionSheet(_CupertinoModal):
            curve: 20
     """
 
+    virtualize_threshold = NumericProperty(12)
+    """
+    Number of actions (excluding cancel actions) of :class:`CupertinoActionSheet` above which actions given to
+    :meth:`set_actions` as dictionaries are shown in a scrollable list that only builds the visible actions
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoActionSheet(virtualize_threshold=20)
+   
+    **KV**
+    
+    .. code-block::
+    
+       CupertinoActionSheet:
+           virtualize_threshold: 20
+    """
+
     def __init__(self, **kwargs):
         """
         Initialize variables of :class:`CupertinoActionSheet`
@@ -506,18 +1019,41 @@ class CupertinoActionSheet(_CupertinoModal):
         :param kwargs: Keyword arguments for :class:`CupertinoActionSheet`
         """
 
+        self._title_label = _ActionSheetLabel(bold=True)
+        self._message_label = _ActionSheetLabel()
+        self._action_list = None
         super().__init__(**kwargs)
 
-        self._title_label = _ActionSheetLabel(bold=True, color=self.text_color)
-        self._message_label = _ActionSheetLabel(color=self.text_color)
-        self.bind(action_height=lambda *args: self._configure_shape())
+        self._title_label.color = self._message_label.color = self.text_color
+        self.bind(
+            action_height=lambda *args: self._configure_shape(),
+            height=lambda *args: self._configure_shape()
+        )
+        # The space left for a virtualized list depends on the laid out title, message and cancel button
+        self._message_frame.bind(height=lambda *args: self._configure_shape())
+        self._cancel.bind(height=lambda *args: self._configure_shape())
+        if self.title.strip():
+            self.on_title(self, self.title)
+        if self.message.strip():
+            self.on_message(self, self.message)
 
     def _configure_shape(self):
         """
         Configure shape of dialog based on present :attr:`children`
         """
 
-        if self._actions.children:
+        if self._batching:
+            return
+        if self._is_virtualized():
+            action_list = self._action_list
+            action_list.action_height = self.action_height
+            action_list.spacing = self.spacing
+            action_list.curve = self.curve
+            action_list.show_frame = bool(self._show_frame)
+            limit = self.height - self._cancel.height - self._message_frame.height - dp(60)
+            self._actions.height = max(self.action_height, min(len(action_list.data) * self.action_height, limit))
+            action_list.refresh_from_data()
+        elif self._actions.children:
             self._actions.height = ((len(self._actions.children) + 1) / 2) * self.action_height
 
             for action in self._actions.children:
@@ -525,6 +1061,15 @@ class CupertinoActionSheet(_CupertinoModal):
             self._actions.children[0]._radii[2:] = dp(self.curve), dp(self.curve)
             self._actions.children[-1]._radii[:2] = (0, 0) if self._show_frame else (dp(self.curve), dp(self.curve))
 
+    def _present(self, progress):
+        """
+        Slide :class:`CupertinoActionSheet` up from the bottom of the window
+
+        :param progress: Progress of the presentation, from ``0`` when dismissed to ``1`` when open
+        """
+
+        self._presentation_translate.y = -self._message_frame.top * (1 - progress)
+
     def on_text_color(self, instance, value):
         """
         Callback when :attr:`text_color` is changed
@@ -545,6 +1090,8 @@ class CupertinoActionSheet(_CupertinoModal):
         """
 
         self._title_label.text = value
+        if getattr(self, '_message_frame', None) is None:
+            return
         if self._title_label.parent is None:
             self._message_frame.add_widget(self._title_label, 1)
         elif not value.strip():
@@ -560,6 +1107,8 @@ class CupertinoActionSheet(_CupertinoModal):
         """
 
         self._message_label.text = value
+        if getattr(self, '_message_frame', None) is None:
+            return
         if self._message_label.parent is None:
             self._message_frame.add_widget(self._message_label)
         elif not value.strip():
@@ -581,7 +1130,7 @@ class CupertinoActionSheet(_CupertinoModal):
             else:
                 self._actions.add_widget(widget, index)
                 if len(self._actions.children) > 1:
-                    self._actions.add_widget(_Separator(size_hint_y=None, height=self.spacing), index + 1)
+                    self._actions.add_widget(self._get_separator(size_hint_y=None, height=self.spacing), index + 1)
             self._configure_shape()
         else:
             super().add_widget(widget, index, canvas)
@@ -609,6 +1158,134 @@ class CupertinoActionSheet(_CupertinoModal):
         self._cancel.clear_widgets(children)
         super().clear_widgets(children)
 
+    def set_actions(self, actions):
+        """
+        Replace all instances of :class:`CupertinoModalButton` of :class:`CupertinoActionSheet`, including those with
+        :attr:`CupertinoModalButton.cancel`, updating its shape once
+
+        **Python**
+
+        .. code-block:: python
+
+           action_sheet.set_actions([
+               CupertinoModalButton(text='Delete'),
+               CupertinoModalButton(text='Cancel', cancel=True)
+           ])
+
+        :param actions: List of instances of :class:`CupertinoModalButton` (or dictionaries of their properties, where
+            the ``'on_release'`` key can be a callback when released) in the order they should be shown. If there are
+            more than :attr:`virtualize_threshold` actions that are not cancel actions and they are all
+            dictionaries, they are shown in a scrollable list
+        """
+
+        self._cancel.clear_widgets()
+        if not self._should_virtualize(actions):
+            super().set_actions(actions)
+            return
+
+        is_cancel = [self._is_cancel(action) for action in actions]
+        rows = [action for action, cancel in zip(actions, is_cancel) if not cancel]
+
+        if self._action_list is None:
+            self._action_list = _ActionSheetList()
+        with self.batch():
+            self._remove_actions(self._actions.children[:])
+            self._action_list.data = rows
+            self._action_list.scroll_y = 1
+            self._actions.add_widget(self._action_list)
+            for action, cancel in zip(actions, is_cancel):
+                if cancel:
+                    self.add_widget(self._build_action(action))
+
+    def _get_action_buttons(self):
+        """
+        Get the widgets of the actions of :class:`CupertinoActionSheet` that dispatch ``on_release``, including cancel
+        actions and the scrollable list of actions
+
+        :return: List of the widgets
+        """
+
+        buttons = super()._get_action_buttons() + list(self._cancel.children)
+        if self._is_virtualized():
+            buttons.append(self._action_list)
+        return buttons
+
+    def _is_virtualized(self):
+        """
+        Check if the actions of :class:`CupertinoActionSheet` are shown in a scrollable list
+
+        :return: If the actions are shown in a scrollable list
+        """
+
+        return self._action_list is not None and self._action_list.parent is not None
+
+    @staticmethod
+    def _is_cancel(action):
+        """
+        Check if an action given to :meth:`set_actions` is a cancel action
+
+        :param action: Instance of :class:`CupertinoModalButton` or dictionary of its properties
+        :return: If :param action: is a cancel action
+        """
+
+        return action.get('cancel', False) if isinstance(action, dict) else action.cancel
+
+    def _should_virtualize(self, actions):
+        """
+        Check if :meth:`set_actions` would show actions in a scrollable list, which it does when there are more than
+        :attr:`virtualize_threshold` actions that are not cancel actions and they are all dictionaries
+
+        :param actions: Actions given to :meth:`set_actions`
+        :return: If :param actions: would be shown in a scrollable list
+        """
+
+        rows = [action for action in actions if not self._is_cancel(action)]
+        return len(rows) > self.virtualize_threshold and all(isinstance(row, dict) for row in rows)
+
+
+class _ActionSheetList(RecycleView):
+    """
+    Scrollable list showing actions of :class:`CupertinoActionSheet` from dictionaries of their properties
+    """
+
+    action_height = NumericProperty(dp(45))
+    """
+    Height of rows of :class:`_ActionSheetList`
+    """
+
+    spacing = NumericProperty(dp(1))
+    """
+    Height of separators between rows of :class:`_ActionSheetList`
+    """
+
+    curve = NumericProperty(dp(10))
+    """
+    Curve of the first and last rows of :class:`_ActionSheetList`
+    """
+
+    show_frame = BooleanProperty(False)
+    """
+    If the message frame of :class:`CupertinoActionSheet` is shown above :class:`_ActionSheetList`
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`_ActionSheetList`
+
+        :param kwargs: Keyword arguments for :class:`_ActionSheetList`
+        """
+
+        self.register_event_type('on_release')
+        super().__init__(**kwargs)
+        self.viewclass = _ActionSheetRow
+
+    def on_release(self, action):
+        """
+        Callback when a row of :class:`_ActionSheetList` is released, before the callback of its action
+
+        :param action: Dictionary of the properties of the action
+        """
+
 
 class CupertinoModalButton(CupertinoButton):
     """
@@ -803,3 +1480,416 @@ class CupertinoModalButton(CupertinoButton):
     """
     A :class:`~kivy.properties.ListProperty` defining the radii values of the corners of :class:`CupertinoModalButton`
     """
+
+
+class CupertinoModalPool(EventDispatcher):
+    """
+    Pool of pre-built instances of :class:`CupertinoDialog` or :class:`CupertinoActionSheet` (and of their instances
+    of :class:`CupertinoModalButton`) that are reused instead of being built every time a modal is shown. A modal is
+    reset and returned to the pool once it is dismissed
+
+    **Python**
+
+    .. code-block:: python
+
+       pool = CupertinoModalPool(modal_class=CupertinoActionSheet)
+       pool.prepare()
+
+       sheet = pool.acquire(title='Delete Photo?', actions=[
+           {'text': 'Delete', 'text_color': (1, 0, 0, 1), 'on_release': delete_photo},
+           {'text': 'Cancel', 'cancel': True}
+       ])
+       sheet.open()
+    """
+
+    modal_class = ObjectProperty(CupertinoDialog)
+    """
+    Class of modals in :class:`CupertinoModalPool`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoModalPool(modal_class=CupertinoActionSheet)
+    """
+
+    size = NumericProperty(2)
+    """
+    Maximum number of dismissed modals kept by :class:`CupertinoModalPool`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoModalPool(size=4)
+    """
+
+    created = NumericProperty(0)
+    """
+    Number of modals built by :class:`CupertinoModalPool`
+    """
+
+    reused = NumericProperty(0)
+    """
+    Number of times :meth:`acquire` returned a modal that was already built
+    """
+
+    released = NumericProperty(0)
+    """
+    Number of dismissed modals reset by :class:`CupertinoModalPool`
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoModalPool`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoModalPool`
+        """
+
+        self._modals = []
+        self._buttons = []
+        self._acquired = {}
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def _apply(widget, properties):
+        """
+        Set properties of a widget
+
+        :param widget: Widget to set properties of
+        :param properties: Dictionary of the properties to set
+        :return: Dictionary of the previous values of the properties
+        """
+
+        previous = {}
+        for name, value in properties.items():
+            current = getattr(widget, name)
+            previous[name] = current[:] if isinstance(current, list) else current
+            setattr(widget, name, value)
+        return previous
+
+    def _create(self):
+        """
+        Build a modal of :attr:`modal_class`
+
+        :return: The new modal
+        """
+
+        modal = self.modal_class()
+        modal.bind(_is_open=self._on_modal_open)
+        self.created += 1
+        return modal
+
+    def prepare(self, count=None):
+        """
+        Build modals ahead of time so that :meth:`acquire` does not have to
+
+        :param count: Number of modals to keep ready (:attr:`size` by default)
+        """
+
+        count = self.size if count is None else count
+        while len(self._modals) < count:
+            self._modals.append(self._create())
+
+    def acquire(self, actions=(), **properties):
+        """
+        Get a modal from :class:`CupertinoModalPool`, building one if none are available
+
+        :param actions: Dictionaries of the properties of the instances of :class:`CupertinoModalButton` to add to
+            the modal. The ``'on_release'`` key can be a callback when the action is released. Every action dismisses
+            the modal when released
+        :param properties: Properties to set on the modal, such as ``title`` and ``message``
+        :return: Modal ready to be opened
+        """
+
+        if self._modals:
+            modal = self._modals.pop()
+            self.reused += 1
+        else:
+            modal = self._create()
+
+        previous = self._apply(modal, properties)
+
+        if isinstance(modal, CupertinoActionSheet) and modal._should_virtualize(actions):
+            modal.set_actions([dict(action, on_release=self._dismissing(modal, action.get('on_release')))
+                               for action in actions])
+            self._acquired[modal] = (previous, [])
+            return modal
+
+        buttons = []
+        for action in actions:
+            button = self._buttons.pop() if self._buttons else CupertinoModalButton()
+            button_previous = self._apply(button, {name: value for name, value in action.items()
+                                                   if name != 'on_release'})
+            # Callbacks bound last are called first
+            callbacks = [modal.dismiss]
+            if action.get('on_release') is not None:
+                callbacks.append(action['on_release'])
+            for callback in callbacks:
+                button.bind(on_release=callback)
+            buttons.append((button, button_previous, callbacks))
+        modal.set_actions([button for button, _, _ in buttons])
+
+        self._acquired[modal] = (previous, buttons)
+        return modal
+
+    @staticmethod
+    def _dismissing(modal, callback):
+        """
+        Create a callback for an action that dismisses a modal after calling the callback of the action
+
+        :param modal: Modal to dismiss
+        :param callback: Callback of the action (Optional)
+        :return: The new callback
+        """
+
+        def on_release(instance):
+            if callback is not None:
+                callback(instance)
+            modal.dismiss()
+        return on_release
+
+    def _on_modal_open(self, modal, is_open):
+        """
+        Callback when a modal of :class:`CupertinoModalPool` is opened or completely dismissed
+
+        :param modal: The modal
+        :param is_open: If the modal is open
+        """
+
+        if not is_open and modal in self._acquired:
+            self.release(modal)
+
+    def release(self, modal):
+        """
+        Reset a modal acquired from :class:`CupertinoModalPool` and return it to the pool. Modals are released
+        automatically when dismissed
+
+        :param modal: Modal returned by :meth:`acquire`
+        """
+
+        previous, buttons = self._acquired.pop(modal)
+        modal.clear_widgets()
+        self._apply(modal, previous)
+
+        for button, button_previous, callbacks in buttons:
+            for callback in callbacks:
+                button.unbind(on_release=callback)
+            self._apply(button, button_previous)
+            button.state = 'normal'
+            self._buttons.append(button)
+
+        if len(self._modals) < self.size:
+            self._modals.append(modal)
+        self.released += 1
+
+
+class CupertinoAlertQueue(EventDispatcher):
+    """
+    Queue of alerts presented one at a time. Pending alerts are kept as descriptions of their properties and actions,
+    and each one is built from a :class:`CupertinoModalPool` only when the alert before it is dismissed. An alert that
+    is identical to one being shown or waiting to be shown is dropped
+
+    **Python**
+
+    .. code-block:: python
+
+       alerts = CupertinoAlertQueue()
+
+       def on_sync_error(error):
+           alerts.push(title='Sync Failed', message=str(error), actions=[{'text': 'OK'}])
+    """
+
+    pool = ObjectProperty(None)
+    """
+    Instance of :class:`CupertinoModalPool` that alerts of :class:`CupertinoAlertQueue` are built from (a pool of
+    instances of :class:`CupertinoDialog` by default)
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoAlertQueue(pool=CupertinoModalPool(modal_class=CupertinoActionSheet))
+    """
+
+    current = ObjectProperty(None, allownone=True)
+    """
+    Alert of :class:`CupertinoAlertQueue` being shown (``None`` if no alert is shown)
+    """
+
+    pending = NumericProperty(0)
+    """
+    Number of alerts of :class:`CupertinoAlertQueue` waiting to be shown
+    """
+
+    coalesced = NumericProperty(0)
+    """
+    Number of alerts dropped by :class:`CupertinoAlertQueue` because they were identical to another alert
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoAlertQueue`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoAlertQueue`
+        """
+
+        self._queue = deque()
+        self._keys = set()
+        self._current_key = None
+        self._trigger_next = Clock.create_trigger(self._present_next)
+        super().__init__(**kwargs)
+        if self.pool is None:
+            self.pool = CupertinoModalPool()
+
+    @classmethod
+    def _freeze(cls, value):
+        """
+        Convert a value to a hashable value that compares equal for equal values
+
+        :param value: Value to convert
+        :return: The hashable value
+        """
+
+        if isinstance(value, dict):
+            return tuple(sorted((name, cls._freeze(item)) for name, item in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(item) for item in value)
+        return value
+
+    def push(self, actions=(), **properties):
+        """
+        Add an alert to :class:`CupertinoAlertQueue`, showing it once the alerts before it are dismissed
+
+        :param actions: Dictionaries of the properties of the actions of the alert, as passed to
+            :meth:`CupertinoModalPool.acquire`
+        :param properties: Properties of the alert, such as ``title`` and ``message``
+        :return: If the alert was added, or ``False`` if it was dropped because an identical alert is shown or waiting
+        """
+
+        # Callbacks are ignored when comparing alerts, so repeated events that build new callbacks are still dropped
+        key = self._freeze((properties, [{name: value for name, value in action.items() if name != 'on_release'}
+                                         for action in actions]))
+        if key in self._keys:
+            self.coalesced += 1
+            return False
+
+        self._keys.add(key)
+        self._queue.append((key, tuple(actions), properties))
+        self.pending = len(self._queue)
+        if self.current is None:
+            self._trigger_next()
+        return True
+
+    def clear(self):
+        """
+        Drop all alerts of :class:`CupertinoAlertQueue` waiting to be shown, leaving the current alert open
+        """
+
+        self._queue.clear()
+        self._keys = {self._current_key} if self._current_key is not None else set()
+        self.pending = 0
+
+    def _present_next(self, *args):
+        """
+        Build and open the next alert of :class:`CupertinoAlertQueue` if no alert is shown
+
+        :param args: Arguments of the callback
+        """
+
+        if self.current is not None or not self._queue:
+            return
+
+        key, actions, properties = self._queue.popleft()
+        self.pending = len(self._queue)
+        self._current_key = key
+        self.current = self.pool.acquire(actions, **properties)
+        self.current.bind(_is_open=self._on_alert_open)
+        self.current.open()
+
+    def _on_alert_open(self, alert, is_open):
+        """
+        Callback when the current alert of :class:`CupertinoAlertQueue` is opened or completely dismissed
+
+        :param alert: The alert
+        :param is_open: If the alert is open
+        """
+
+        if is_open:
+            return
+        alert.unbind(_is_open=self._on_alert_open)
+        self._keys.discard(self._current_key)
+        self._current_key = None
+        self.current = None
+        # The next alert is built on the next frame, once the pool has released the dismissed alert to be reused
+        self._trigger_next()
+
+
+class _ActionSheetRow(RecycleDataViewBehavior, CupertinoModalButton):
+    """
+    Row of :class:`_ActionSheetList` showing an action of :class:`CupertinoActionSheet`
+    """
+
+    separator_height = NumericProperty(0)
+    """
+    Height of the separator at the top of :class:`_ActionSheetRow`
+    """
+
+    _defaults = None
+    """
+    Default values of the properties of :class:`CupertinoModalButton`, restored when a row is reused for an action
+    that does not set them
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`_ActionSheetRow`
+
+        :param kwargs: Keyword arguments for :class:`_ActionSheetRow`
+        """
+
+        self._callback = None
+        self._list = None
+        self._index = None
+        super().__init__(**kwargs)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """
+        Callback when :class:`_ActionSheetRow` is bound to an action
+
+        :param rv: Instance of :class:`_ActionSheetList` showing :class:`_ActionSheetRow`
+        :param index: Index of the action
+        :param data: Dictionary of the properties of the action
+        """
+
+        if _ActionSheetRow._defaults is None:
+            _ActionSheetRow._defaults = {
+                name: CupertinoModalButton.__dict__[name].defaultvalue
+                for name in ['text', 'font_size', 'disabled', 'color_normal', 'color_down', 'color_disabled',
+                             'text_color']
+            }
+
+        attributes = dict(self._defaults)
+        attributes.update(data)
+        self._callback = attributes.pop('on_release', None)
+        attributes.pop('cancel', None)
+        self._list = rv
+        self._index = index
+        super().refresh_view_attrs(rv, index, attributes)
+
+        curve = dp(rv.curve)
+        top = curve if index == 0 and not rv.show_frame else 0
+        bottom = curve if index == len(rv.data) - 1 else 0
+        self._radii = [top, top, bottom, bottom]
+        self.separator_height = rv.spacing if index > 0 else 0
+        self.state = 'normal'
+
+    def on_release(self):
+        """
+        Callback when :class:`_ActionSheetRow` is released
+        """
+
+        if self._list is not None:
+            self._list.dispatch('on_release', self._list.data[self._index])
+        if self._callback is not None:
+            self._callback(self)
@@ -2,68 +2,80 @@
 Pages allow for a separation of different features
 """
 
-from kivy.uix.boxlayout import BoxLayout
+import os
+from json import dump, load
+from functools import partial
+from itertools import count
 from kivy.uix.widget import Widget
-from kivy.uix.screenmanager import ScreenManager, NoTransition
+from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.behaviors import ButtonBehavior
-from kivy.properties import BooleanProperty, ColorProperty
+from kivy.uix.screenmanager import ScreenManager, Screen, TransitionBase, NoTransition
+from kivy.graphics import Fbo, ClearColor, ClearBuffers, Color, Rectangle, Ellipse, Translate, InstructionGroup, \
+    PushMatrix, PopMatrix
+from kivy.properties import BooleanProperty, ColorProperty, ListProperty, NumericProperty, OptionProperty
+from kivy.animation import Animation, AnimationTransition
+from kivy.metrics import dp
+from kivycupertino.uix.gesture import VelocityTracker
+from kivy.clock import Clock
+from kivy.logger import Logger
 from kivy.lang.builder import Builder
 
 __all__ = [
+    'CupertinoNavigationController',
     'CupertinoPageControls',
-    'CupertinoScreenManager'
+    'CupertinoScreenManager',
+    'CupertinoTransition'
 ]
 
 Builder.load_string("""
-<_CupertinoScreen>:
-    on_press: self.parent._change_screen(self.parent.children[::-1].index(self))
-    
-    canvas.before:
-        Color:
-            rgba: self.color_selected if self.selected else self.color_unselected
-        Ellipse:
-            size: dp(self.height), dp(self.height)
-            pos: self.x+self.width/2-self.height/2, self.y
-
 <CupertinoPageControls>:
-    padding: self.height/3
-    spacing: self.height/3
-    
     canvas.before:
         Color:
             rgba: self.background_color
         Rectangle:
             size: self.size
             pos: self.pos
-""")
-
 
-class _CupertinoScreen(ButtonBehavior, Widget):
-    """
-    Dot to be added to :class:`CupertinoPageControls` indicating
-    a screen on :class:`CupertinoScreenManager`
-    """
+<CupertinoNavigationController>:
+    _manager: manager
+    orientation: 'vertical'
 
-    selected = BooleanProperty(False)
-    """
-    If the screen represented by :class:`_CupertinoScreen` is currently selected
-    """
+    CupertinoNavigationBar:
+        title: root.stack[-1]['title'] if root.stack else ''
+        size_hint_y: None
+        height: dp(44)
 
-    color_selected = ColorProperty()
-    """
-    Color of :class:`_CupertinoScreen` when selected
-    """
+        BoxLayout:
+            opacity: 1 if len(root.stack) > 1 else 0
+            size_hint: 0.25, 1
+            pos_hint: {'x': 0, 'center_y': 0.5}
 
-    color_unselected = ColorProperty()
-    """
-    Color of :class:`_CupertinoScreen` when not selected
-    """
+            CupertinoSymbolButton:
+                symbol: 'chevron_left'
+                color_normal: 0.05, 0.5, 0.95, 1
+                color_down: 0, 0.15, 0.3, 1
+                size_hint_x: None
+                width: self.height * 0.7
+                on_release: root.pop()
+            CupertinoSystemButton:
+                text: root.stack[-2]['title'] if len(root.stack) > 1 else ' '
+                font_size: '17sp'
+                shorten: True
+                text_size: self.size
+                halign: 'left'
+                valign: 'middle'
+                on_release: root.pop()
+    CupertinoScreenManager:
+        id: manager
+        prefetch: False
+""")
 
 
-class CupertinoPageControls(BoxLayout):
+class CupertinoPageControls(Widget):
     """
     iOS style Page Controls. Will automatically update the number of pages and current page
-    when added to an instance of :class:`CupertinoScreenManager`
+    when added to an instance of :class:`CupertinoScreenManager`. All dots are drawn by one group of canvas
+    instructions, and at most :attr:`max_dots` dots are shown
     
     .. image:: ../_static/page_controls/demo.gif
     """
@@ -149,6 +161,115 @@ class CupertinoPageControls(BoxLayout):
            color_unselected: 0.5, 0, 0, 1
     """
 
+    max_dots = NumericProperty(9)
+    """
+    Maximum number of dots shown by :class:`CupertinoPageControls`. When there are more pages, only the dots around
+    the current page are shown, and the dots at the edges are smaller to show that there are more pages
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoPageControls(max_dots=5)
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoPageControls:
+           max_dots: 5
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoPageControls`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoPageControls`
+        """
+
+        self._count = 0
+        self._page = 0
+        self._first = 0
+        self._ellipses = []
+        self._trigger_dots = Clock.create_trigger(self._update_dots, -1)
+        super().__init__(**kwargs)
+
+        with self.canvas:
+            self._unselected_color = Color(rgba=self.color_unselected)
+            self._unselected = InstructionGroup()
+            self._selected_color = Color(rgba=self.color_selected)
+            self._selected = Ellipse(size=(0, 0))
+        self.bind(pos=self._trigger_dots, size=self._trigger_dots, max_dots=self._trigger_dots)
+
+    def on_color_selected(self, instance, value):
+        """
+        Callback when :attr:`color_selected` is changed
+
+        :param instance: Instance of :class:`CupertinoPageControls`
+        :param value: New value of :attr:`color_selected`
+        """
+
+        if hasattr(self, '_selected_color'):
+            self._selected_color.rgba = value
+
+    def on_color_unselected(self, instance, value):
+        """
+        Callback when :attr:`color_unselected` is changed
+
+        :param instance: Instance of :class:`CupertinoPageControls`
+        :param value: New value of :attr:`color_unselected`
+        """
+
+        if hasattr(self, '_unselected_color'):
+            self._unselected_color.rgba = value
+
+    def _get_geometry(self):
+        """
+        Compute where the dots of :class:`CupertinoPageControls` are drawn
+
+        :return: Number of dots shown, diameter of a dot, distance between the centers of dots and horizontal position
+            of the first dot
+        """
+
+        shown = min(self._count, max(1, int(self.max_dots)))
+        diameter = self.height / 3
+        pitch = diameter * 2
+        return shown, diameter, pitch, self.center_x - (shown * pitch - diameter) / 2
+
+    def _update_dots(self, *args):
+        """
+        Update the canvas instructions of the dots of :class:`CupertinoPageControls`
+
+        :param args: Arguments of the callback
+        """
+
+        shown, diameter, pitch, x = self._get_geometry()
+        self._first = min(max(0, self._page - shown // 2), self._count - shown) if shown else 0
+
+        # Ellipses are reused, so only the number of dots shown changes the instructions
+        unselected = shown - 1 if self._first <= self._page < self._first + shown else shown
+        while len(self._ellipses) < unselected:
+            ellipse = Ellipse()
+            self._unselected.add(ellipse)
+            self._ellipses.append(ellipse)
+        while len(self._ellipses) > unselected:
+            self._unselected.remove(self._ellipses.pop())
+
+        self._selected.size = 0, 0
+        ellipses = iter(self._ellipses)
+        for dot in range(shown):
+            page = self._first + dot
+            scale = 1
+            if (dot == 0 and self._first > 0) or (dot == shown - 1 and page < self._count - 1):
+                scale = 0.5
+            elif (dot == 1 and self._first > 0) or (dot == shown - 2 and self._first + shown < self._count):
+                scale = 0.75
+
+            size = diameter * scale
+            ellipse = self._selected if page == self._page else next(ellipses)
+            ellipse.size = size, size
+            ellipse.pos = x + dot * pitch + (diameter - size) / 2, self.center_y - size / 2
+
     def on_parent(self, instance, parent):
         """
         Callback when :class:`CupertinoPageControls` is added to :class:`CupertinoScreenManager`
@@ -159,17 +280,19 @@ class CupertinoPageControls(BoxLayout):
 
         assert isinstance(parent, CupertinoScreenManager), 'CupertinoPageControls must be added to an ' \
                                                            'instance of CupertinoScreenManager'
-        parent.bind(screen_names=self._add_screen, current=self._select_screen)
+        parent.bind(page_names=self._update_pages, current=self._select_screen)
+        self._update_pages(parent, parent.page_names)
 
-    def _add_screen(self, instance, name):
+    def _update_pages(self, instance, names):
         """
-        Callback when a new screen is added to the parent of :class:`CupertinoPageControls`
+        Callback when a page is added to or removed from the parent of :class:`CupertinoPageControls`
 
-        :param instance: Instance of class :class:`CupertinoPageControls`
-        :param name: Name of added screen
+        :param instance: Instance of :class:`CupertinoScreenManager`
+        :param names: Names of the pages
         """
 
-        self.add_widget(_CupertinoScreen(color_selected=self.color_selected, color_unselected=self.color_unselected))
+        self._count = len(names)
+        self._select_screen(instance, instance.current)
 
     def _select_screen(self, instance, name):
         """
@@ -180,8 +303,24 @@ class CupertinoPageControls(BoxLayout):
         :param name: Name of selected screen
         """
 
-        for i in range(len(self.children)):
-            self.children[i].selected = len(self.children) - 1 - i == instance.screen_names.index(name)
+        self._page = instance.page_names.index(name) if name in instance.page_names else -1
+        self._trigger_dots()
+
+    def on_touch_down(self, touch):
+        """
+        Callback when :class:`CupertinoPageControls` is touched, switching to the page of the dot that was touched
+
+        :param touch: Touch on :class:`CupertinoPageControls`
+        """
+
+        if not self.tap or not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+
+        shown, diameter, pitch, x = self._get_geometry()
+        dot = int((touch.x - x + (pitch - diameter) / 2) // pitch)
+        if 0 <= dot < shown:
+            self._change_screen(self._first + dot)
+        return True
 
     def _change_screen(self, index):
         """
@@ -190,17 +329,680 @@ class CupertinoPageControls(BoxLayout):
         :param index: Index of screen
         """
 
-        if self.tap:
-            self.parent.transition = NoTransition()
-            self.parent.current = self.parent.screen_names[index]
+        manager = self.parent
+        if self.tap and index != self._page:
+            if not isinstance(manager.transition, CupertinoTransition):
+                manager.transition = CupertinoTransition()
+            manager.transition.mode = 'left' if index > self._page else 'right'
+            manager.current = manager.page_names[index]
+
+
+class _ScreenSnapshot:
+    """
+    Texture of a screen rendered to a framebuffer, which is reused by the next render of a screen of the same size
+    """
+
+    def __init__(self):
+        """
+        Initialize variables of :class:`_ScreenSnapshot`
+        """
+
+        self._fbo = None
+        self._translate = None
+        self.texture = None
+
+    def render(self, screen):
+        """
+        Render a screen that has no parent. The screen is rendered where it was last drawn, since instructions bound
+        to its position are only updated before the next frame
+
+        :param screen: Screen to render
+        :return: Texture of :param screen:
+        """
+
+        size = int(screen.width), int(screen.height)
+        if self._fbo is None or tuple(self._fbo.size) != size:
+            self._fbo = Fbo(size=size, with_stencilbuffer=True)
+            with self._fbo:
+                ClearColor(0, 0, 0, 0)
+                ClearBuffers()
+                self._translate = Translate()
+
+        self._translate.xy = -screen.x, -screen.y
+        self._fbo.add(screen.canvas)
+        try:
+            self._fbo.draw()
+        finally:
+            self._fbo.remove(screen.canvas)
+        self.texture = self._fbo.texture
+        return self.texture
+
+
+class CupertinoTransition(TransitionBase):
+    """
+    iOS style transition between screens of a :class:`~kivy.uix.screenmanager.ScreenManager`. Both screens are
+    rendered to textures once, when the transition starts, and only the textures are animated, so the time of each
+    frame does not depend on how complex the screens are. Changes to the screens are not shown until the transition
+    completes
+
+    **Python**
+
+    .. code-block:: python
+
+       manager.transition = CupertinoTransition(mode='push')
+       manager.current = 'detail'
+    """
+
+    mode = OptionProperty('left', options=['push', 'pop', 'left', 'right'])
+    """
+    How screens of :class:`CupertinoTransition` move. ``'push'`` slides the new screen in from the right over the
+    current screen, ``'pop'`` slides the current screen out to the right to uncover the new screen, and ``'left'`` and
+    ``'right'`` move both screens in that direction like pages
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoTransition(mode='pop')
+    """
+
+    duration = NumericProperty(0.35)
+    """
+    Duration in seconds of :class:`CupertinoTransition`
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoTransition(duration=0.5)
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoTransition`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoTransition`
+        """
+
+        self._snapshot_in = _ScreenSnapshot()
+        self._snapshot_out = _ScreenSnapshot()
+        self._group = None
+        self._quads = None
+        super().__init__(**kwargs)
+
+    def add_screen(self, screen):
+        """
+        Add the new screen to the manager, next to the current screen, so that it is laid out before it is rendered
+
+        :param screen: New screen
+        """
+
+        screen.size = self.screen_out.size
+        screen.pos = self.screen_out.pos
+        if self.mode in ('push', 'left'):
+            screen.x += screen.width
+        elif self.mode == 'right':
+            screen.x -= screen.width
+        super().add_screen(screen)
+
+    def _take_snapshots(self):
+        """
+        Replace both screens of :class:`CupertinoTransition` with textures of them
+        """
+
+        # A canvas can only have one parent, so the screens are removed from the manager before they are rendered
+        manager = self.manager
+        manager.real_remove_widget(self.screen_in)
+        manager.real_remove_widget(self.screen_out)
+        texture_in = self._snapshot_in.render(self.screen_in)
+        texture_out = self._snapshot_out.render(self.screen_out)
+
+        self._group = InstructionGroup()
+        quad_in = Rectangle(texture=texture_in, size=self.screen_in.size)
+        quad_out = Rectangle(texture=texture_out, size=self.screen_out.size)
+        shade = Color(0, 0, 0, 0)
+        shade_quad = Rectangle(size=self.screen_out.size)
+
+        # The screen that slides over the other one is drawn last, and the other one is shaded under it
+        below, above = (quad_in, quad_out) if self.mode == 'pop' else (quad_out, quad_in)
+        self._group.add(Color(1, 1, 1, 1))
+        self._group.add(below)
+        if self.mode in ('push', 'pop'):
+            self._group.add(shade)
+            self._group.add(shade_quad)
+            self._group.add(Color(1, 1, 1, 1))
+        self._group.add(above)
+        manager.canvas.add(self._group)
+        self._quads = (quad_in, quad_out, shade, shade_quad)
+
+    def on_progress(self, progress):
+        """
+        Callback when :class:`CupertinoTransition` progresses
+
+        :param progress: Progress of the transition, from ``0`` to ``1``
+        """
+
+        if progress <= 0:
+            return
+        if self._quads is None:
+            self._take_snapshots()
+
+        progress = AnimationTransition.out_cubic(progress)
+        quad_in, quad_out, shade, shade_quad = self._quads
+        x, y = self.manager.pos
+        width = self.manager.width
+        if self.mode == 'push':
+            offset_in, offset_out = width * (1 - progress), -width * 0.3 * progress
+            shade.a = 0.1 * progress
+        elif self.mode == 'pop':
+            offset_in, offset_out = -width * 0.3 * (1 - progress), width * progress
+            shade.a = 0.1 * (1 - progress)
+        elif self.mode == 'left':
+            offset_in, offset_out = width * (1 - progress), -width * progress
+        else:
+            offset_in, offset_out = -width * (1 - progress), width * progress
+
+        quad_in.pos = x + offset_in, y
+        quad_out.pos = x + offset_out, y
+        shade_quad.pos = quad_in.pos if self.mode == 'pop' else quad_out.pos
+
+    def remove_screen(self, screen):
+        """
+        Remove the textures of :class:`CupertinoTransition` and show the new screen again
+
+        :param screen: Previous screen
+        """
+
+        if self._group is not None:
+            self.manager.canvas.remove(self._group)
+        self._group = None
+        self._quads = None
+        super().remove_screen(screen)
+        self.screen_in.pos = self.manager.pos
+        if self.screen_in.parent is None:
+            self.manager.real_add_widget(self.screen_in)
 
 
 class CupertinoScreenManager(ScreenManager):
     """
     A Screen Manager widget that also accepts an instance of
-    :class:`CupertinoPageControls`
+    :class:`CupertinoPageControls`. Screens can be registered as factories with :meth:`register_screen`, so that they
+    are only built when they are first shown
+
+    **Python**
+
+    .. code-block:: python
+
+       manager = CupertinoScreenManager(max_screens=3)
+       for i in range(30):
+           manager.register_screen(f'page {i}', lambda: OnboardingPage())
     """
 
+    page_names = ListProperty()
+    """
+    Names of the pages of :class:`CupertinoScreenManager` in order, including screens registered with
+    :meth:`register_screen` that are not built
+    """
+
+    prefetch = BooleanProperty(True)
+    """
+    If screens registered with :meth:`register_screen` next to the current screen should be built ahead of time,
+    one per frame
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoScreenManager(prefetch=False)
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoScreenManager:
+           prefetch: False
+    """
+
+    max_screens = NumericProperty(0)
+    """
+    Maximum number of screens built from factories registered with :meth:`register_screen` that are kept, or ``0``
+    to keep all of them. The least recently shown screens are removed first, but the current screen and the screens
+    next to it are always kept. Before a screen is removed, the value returned by its ``save_state()`` method (if it
+    has one) is kept and passed to the ``restore_state(state)`` method of the screen when it is built again
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoScreenManager(max_screens=3)
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoScreenManager:
+           max_screens: 3
+    """
+
+    swipe = BooleanProperty(False)
+    """
+    If pages of :class:`CupertinoScreenManager` can be changed by swiping horizontally. While swiping, only the
+    current screen is shown live and the pages next to it are shown from textures rendered when the page last settled
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoScreenManager(swipe=True)
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoScreenManager:
+           swipe: True
+    """
+
+    _swipe_offset = NumericProperty(0)
+    """
+    Horizontal distance the current page of :class:`CupertinoScreenManager` is swiped by
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoScreenManager`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoScreenManager`
+        """
+
+        self._snapshots = {}
+        self._swiped = None
+        self._swipe_key = None
+        self._tracker = VelocityTracker()
+        self._swipe_push = PushMatrix()
+        self._swipe_translate = Translate()
+        self._swipe_pop = PopMatrix()
+        self._swipe_group = InstructionGroup()
+        self._swipe_quads = {}
+        self._trigger_snapshots = Clock.create_trigger(self._update_snapshots)
+        self._factories = {}
+        self._states = {}
+        self._recent = []
+        self._trigger_prefetch = Clock.create_trigger(self._prefetch_next)
+        self._trigger_evict = Clock.create_trigger(self._evict)
+        kwargs.setdefault('transition', CupertinoTransition())
+        super().__init__(**kwargs)
+        self._swipe_key = f'cupertino_swipe.{self.uid}'
+        self.bind(
+            current=self._on_current_changed,
+            max_screens=self._trigger_evict,
+            swipe=self._trigger_snapshots,
+            size=self._trigger_snapshots,
+            _swipe_offset=self._move_swipe
+        )
+
+    def register_screen(self, name, factory, index=None, state=None):
+        """
+        Register a page of :class:`CupertinoScreenManager` that is built when it is first shown
+
+        :param name: Name of the page
+        :param factory: Callable taking no arguments that returns the :class:`~kivy.uix.screenmanager.Screen` of the
+            page, which is given :param name:
+        :param index: Index in :attr:`page_names` to add the page at (at the end by default)
+        :param state: State passed to the ``restore_state(state)`` method of the screen when it is built
+        """
+
+        self._factories[name] = factory
+        if state is not None:
+            self._states[name] = state
+        if name not in self.page_names:
+            self.page_names.insert(len(self.page_names) if index is None else index, name)
+        if self.current is None:
+            self.current = name
+        else:
+            self._trigger_prefetch()
+
+    def unregister_screen(self, name):
+        """
+        Remove a page registered with :meth:`register_screen` from :class:`CupertinoScreenManager`, along with its
+        screen if it is built and its saved state
+
+        :param name: Name of the page
+        """
+
+        self._factories.pop(name, None)
+        self._states.pop(name, None)
+        if name in self.page_names:
+            self.page_names.remove(name)
+        if name in self._recent:
+            self._recent.remove(name)
+        if self.has_screen(name):
+            screen = super().get_screen(name)
+            super().remove_widget(screen)
+            if screen.parent is self:
+                self.real_remove_widget(screen)
+
+    def get_state(self, name):
+        """
+        Get the state of a page of :class:`CupertinoScreenManager`, which is the value returned by the
+        ``save_state()`` method of its screen if it is built, or the state saved for it otherwise
+
+        :param name: Name of the page
+        :return: State of the page, or ``None`` if it has none
+        """
+
+        if self.has_screen(name):
+            screen = super().get_screen(name)
+            return screen.save_state() if hasattr(screen, 'save_state') else None
+        return self._states.get(name)
+
+    def get_screen(self, name):
+        """
+        Get a screen of :class:`CupertinoScreenManager`, building it if it was registered with :meth:`register_screen`
+        and is not built
+
+        :param name: Name of the screen
+        :return: Instance of :class:`~kivy.uix.screenmanager.Screen`
+        """
+
+        if name in self._factories and not self.has_screen(name):
+            self._build_screen(name)
+        return super().get_screen(name)
+
+    def _build_screen(self, name):
+        """
+        Build a screen registered with :meth:`register_screen`, restoring its saved state
+
+        :param name: Name of the screen
+        """
+
+        screen = self._factories[name]()
+        screen.name = name
+        state = self._states.pop(name, None)
+        if state is not None and hasattr(screen, 'restore_state'):
+            screen.restore_state(state)
+        super().add_widget(screen)
+        self._recent.append(name)
+
+    def _get_adjacent(self, name):
+        """
+        Get the names of the pages next to a page of :class:`CupertinoScreenManager`
+
+        :param name: Name of the page
+        :return: List of the names of the pages
+        """
+
+        if name not in self.page_names:
+            return []
+        index = self.page_names.index(name)
+        return self.page_names[max(0, index - 1):index] + self.page_names[index + 1:index + 2]
+
+    def _on_current_changed(self, instance, name):
+        """
+        Callback when the current screen of :class:`CupertinoScreenManager` is changed
+
+        :param instance: Instance of :class:`CupertinoScreenManager`
+        :param name: Name of the current screen
+        """
+
+        if name in self._recent:
+            self._recent.remove(name)
+            self._recent.append(name)
+        self._trigger_prefetch()
+        self._trigger_evict()
+        self._trigger_snapshots()
+
+    def _prefetch_next(self, *args):
+        """
+        Build the next screen next to the current screen that is not built, building one screen per frame
+
+        :param args: Arguments of the callback
+        """
+
+        if not self.prefetch:
+            return
+        for name in self._get_adjacent(self.current):
+            if name in self._factories and not self.has_screen(name):
+                self._build_screen(name)
+                self._trigger_prefetch()
+                self._trigger_evict()
+                return
+
+    def _evict(self, *args):
+        """
+        Remove the least recently shown screens built from factories until at most :attr:`max_screens` are kept
+
+        :param args: Arguments of the callback
+        """
+
+        if not self.max_screens:
+            return
+        if self.transition.is_active:
+            self._trigger_evict()
+            return
+
+        kept = {self.current, *self._get_adjacent(self.current)}
+        built = [name for name in self._recent if self.has_screen(name)]
+        evictable = [name for name in built if name not in kept]
+        while len(built) > self.max_screens and evictable:
+            name = evictable.pop(0)
+            screen = super().get_screen(name)
+            if hasattr(screen, 'save_state'):
+                self._states[name] = screen.save_state()
+            super().remove_widget(screen)
+            self._recent.remove(name)
+            built.remove(name)
+
+    def _update_snapshots(self, *args):
+        """
+        Render the pages next to the current page of :class:`CupertinoScreenManager` to be shown while swiping,
+        dropping the textures of other pages
+
+        :param args: Arguments of the callback
+        """
+
+        adjacent = self._get_adjacent(self.current) if self.swipe else []
+        for name in list(self._snapshots):
+            if name not in adjacent:
+                del self._snapshots[name]
+        if not adjacent or self._swiped is not None:
+            return
+        if self.transition.is_active:
+            self._trigger_snapshots()
+            return
+
+        for name in adjacent:
+            screen = self.get_screen(name)
+            if screen.parent is not None:
+                self._trigger_snapshots()
+                continue
+            # Screens that were moved or resized are laid out and moved before the next frame, so they are rendered then
+            if list(screen.size) != list(self.size) or list(screen.pos) != list(self.pos):
+                screen.size = self.size
+                screen.pos = self.pos
+                self._trigger_snapshots()
+                continue
+            self._snapshots.setdefault(name, _ScreenSnapshot()).render(screen)
+
+    def _begin_swipe(self):
+        """
+        Start swiping the current page of :class:`CupertinoScreenManager`, showing the pages next to it from textures
+        """
+
+        screen = self.current_screen
+        self._swiped = screen
+        screen.canvas.before.insert(0, self._swipe_translate)
+        screen.canvas.before.insert(0, self._swipe_push)
+        screen.canvas.after.add(self._swipe_pop)
+
+        self._swipe_group.clear()
+        self._swipe_quads = {}
+        self._swipe_group.add(Color(1, 1, 1, 1))
+        index = self.page_names.index(self.current)
+        for side, offset in (('previous', -1), ('next', 1)):
+            if not 0 <= index + offset < len(self.page_names):
+                continue
+            snapshot = self._snapshots.get(self.page_names[index + offset])
+            if snapshot is not None and snapshot.texture is not None:
+                quad = Rectangle(texture=snapshot.texture, size=self.size)
+                self._swipe_group.add(quad)
+                self._swipe_quads[side] = quad
+        self.canvas.before.add(self._swipe_group)
+        self._move_swipe(self, self._swipe_offset)
+
+    def _move_swipe(self, instance, offset):
+        """
+        Callback when the current page of :class:`CupertinoScreenManager` is swiped
+
+        :param instance: Instance of :class:`CupertinoScreenManager`
+        :param offset: Distance the current page is swiped by
+        """
+
+        self._swipe_translate.x = offset
+        for side, quad in self._swipe_quads.items():
+            quad.pos = self.x + offset + (self.width if side == 'next' else -self.width), self.y
+
+    def _end_swipe(self, name):
+        """
+        Stop swiping the current page of :class:`CupertinoScreenManager`, showing another page if it settled on one
+
+        :param name: Name of the page that was settled on, or ``None`` if the current page was
+        """
+
+        screen = self._swiped
+        screen.canvas.before.remove(self._swipe_push)
+        screen.canvas.before.remove(self._swipe_translate)
+        screen.canvas.after.remove(self._swipe_pop)
+        self.canvas.before.remove(self._swipe_group)
+        self._swipe_quads = {}
+        self._swiped = None
+        self._swipe_offset = 0
+
+        if name is not None:
+            # The page was already moved into place by the swipe, so it is shown without a transition
+            transition = self.transition
+            self.transition = NoTransition()
+            self.current = name
+            self.transition = transition
+        self._trigger_snapshots()
+
+    def on_touch_down(self, touch):
+        """
+        Callback when :class:`CupertinoScreenManager` is touched, which may start a swipe
+
+        :param touch: Touch on :class:`CupertinoScreenManager`
+        """
+
+        if (self.swipe and self._swiped is None and self.current in self.page_names and
+                not self.transition.is_active and self.collide_point(*touch.pos)):
+            touch.ud[self._swipe_key] = {'x': touch.x, 'y': touch.y, 'swiping': False}
+            self._tracker.reset()
+            self._tracker.add_touch(touch)
+        return super().on_touch_down(touch)
+
+    def on_touch_move(self, touch):
+        """
+        Callback when a touch moves on :class:`CupertinoScreenManager`, swiping the current page once the touch moves
+        far enough horizontally
+
+        :param touch: Touch on :class:`CupertinoScreenManager`
+        """
+
+        swipe = touch.ud.get(self._swipe_key)
+        if swipe is None:
+            return super().on_touch_move(touch)
+
+        if touch.grab_current is self:
+            self._tracker.add_touch(touch)
+            offset = touch.x - swipe['x']
+            # Pages are resisted when there is no page to swipe to
+            has_page = ('next' if offset < 0 else 'previous') in self._swipe_quads
+            self._swipe_offset = offset if has_page else offset / 3
+            return True
+        if swipe['swiping']:
+            return True
+
+        self._tracker.add_touch(touch)
+        dx, dy = touch.x - swipe['x'], touch.y - swipe['y']
+        if abs(dx) > dp(20) and abs(dx) > abs(dy) and self._swiped is None:
+            swipe['swiping'] = True
+            swipe['x'] = touch.x
+            self._cancel_grabs(touch)
+            touch.grab(self)
+            self._begin_swipe()
+            return True
+        return super().on_touch_move(touch)
+
+    def _cancel_grabs(self, touch):
+        """
+        Take a touch starting a swipe away from the widgets of the current page that grabbed it when it was pressed,
+        releasing buttons without dispatching ``on_release``
+
+        :param touch: Touch starting a swipe
+        """
+
+        for reference in touch.grab_list[:]:
+            widget = reference()
+            if widget is None or widget is self:
+                continue
+            touch.ungrab(widget)
+            if isinstance(widget, ButtonBehavior):
+                widget._do_release()
+
+    def on_touch_up(self, touch):
+        """
+        Callback when a touch is released from :class:`CupertinoScreenManager`, settling a swiped page on the page
+        it was flicked towards
+
+        :param touch: Touch on :class:`CupertinoScreenManager`
+        """
+
+        if touch.grab_current is not self:
+            if touch.ud.get(self._swipe_key, {}).get('swiping'):
+                return True
+            return super().on_touch_up(touch)
+
+        touch.ungrab(self)
+        self._tracker.add_touch(touch)
+        velocity = self._tracker.velocity_x()
+        resting = VelocityTracker.project(self._swipe_offset, velocity)
+        index = self.page_names.index(self.current)
+
+        name = None
+        target = 0
+        if resting < -self.width / 2 and 'next' in self._swipe_quads:
+            name, target = self.page_names[index + 1], -self.width
+        elif resting > self.width / 2 and 'previous' in self._swipe_quads:
+            name, target = self.page_names[index - 1], self.width
+
+        animation = Animation(_swipe_offset=target, t='out_quad',
+                              d=VelocityTracker.duration(target - self._swipe_offset, velocity, 0.35))
+        animation.bind(on_complete=lambda *args: self._end_swipe(name))
+        animation.start(self)
+        return True
+
+    def next(self):
+        """
+        Get the name of the page after the current page of :class:`CupertinoScreenManager`
+
+        :return: Name of the next page
+        """
+
+        if not self.page_names or self.current not in self.page_names:
+            return super().next()
+        return self.page_names[(self.page_names.index(self.current) + 1) % len(self.page_names)]
+
+    def previous(self):
+        """
+        Get the name of the page before the current page of :class:`CupertinoScreenManager`
+
+        :return: Name of the previous page
+        """
+
+        if not self.page_names or self.current not in self.page_names:
+            return super().previous()
+        return self.page_names[(self.page_names.index(self.current) - 1) % len(self.page_names)]
+
     def add_widget(self, widget, *args, **kwargs):
         """
         Callback when a :class:`Screen` or a :class:`CupertinoPageControls` is added to
@@ -212,4 +1014,238 @@ class CupertinoScreenManager(ScreenManager):
         if isinstance(widget, CupertinoPageControls):
             super(ScreenManager, self).add_widget(widget)
         else:
+            if isinstance(widget, Screen) and widget.name not in self.page_names:
+                self.page_names.append(widget.name)
             super().add_widget(widget)
+
+    def remove_widget(self, widget, *args, **kwargs):
+        """
+        Remove a :class:`Screen` from :class:`CupertinoScreenManager`, removing its page unless it was registered
+        with :meth:`register_screen`
+
+        :param widget: Widget to be removed from :class:`CupertinoScreenManager`
+        """
+
+        if isinstance(widget, Screen) and widget.name not in self._factories and widget.name in self.page_names:
+            self.page_names.remove(widget.name)
+        super().remove_widget(widget)
+
+
+class CupertinoNavigationController(BoxLayout):
+    """
+    A :class:`~kivycupertino.uix.bar.CupertinoNavigationBar` paired with a stack of views shown by a
+    :class:`CupertinoScreenManager`. Views are registered by name with :meth:`register_view`, and each entry of
+    :attr:`stack` only describes a view, so the stack can be saved with :meth:`save` and restored with
+    :meth:`restore`, in which case only the screen at the top of the stack is built
+
+    **Python**
+
+    .. code-block:: python
+
+       class MailApp(CupertinoApp):
+           def build(self):
+               self.navigation = CupertinoNavigationController()
+               self.navigation.register_view('mailboxes', MailboxesScreen)
+               self.navigation.register_view('message', MessageScreen)
+               if not self.navigation.restore('navigation.json'):
+                   self.navigation.push('mailboxes', title='Mailboxes')
+               return self.navigation
+
+           def on_stop(self):
+               self.navigation.save('navigation.json')
+    """
+
+    stack = ListProperty()
+    """
+    Entries of the stack of :class:`CupertinoNavigationController`, from the root view to the top view. Each entry
+    is a dictionary with the ``'view'``, ``'params'`` and ``'title'`` given to :meth:`push` and the ``'name'`` of its
+    screen
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoNavigationController`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoNavigationController`
+        """
+
+        self._views = {}
+        self._serial = count()
+        self._discarded = []
+        self._trigger_discard = Clock.create_trigger(self._discard)
+        super().__init__(**kwargs)
+
+    def register_view(self, view, factory):
+        """
+        Register a view that can be pushed onto :class:`CupertinoNavigationController`
+
+        :param view: Name of the view
+        :param factory: Callable that returns the :class:`~kivy.uix.screenmanager.Screen` of the view, called with
+            the parameters the view is pushed with as keyword arguments
+        """
+
+        self._views[view] = factory
+
+    def _add_entry(self, view, params, title, state=None, index=None):
+        """
+        Add an entry to :attr:`stack` and register its screen with the screen manager of
+        :class:`CupertinoNavigationController` without building it
+
+        :param view: Name of the view
+        :param params: Parameters of the view
+        :param title: Title of the view
+        :param state: State of the screen of the view
+        :param index: Index in :attr:`stack` to add the entry at (at the top by default)
+        :return: Name of the screen of the view
+        """
+
+        name = f'{view}.{next(self._serial)}'
+        entry = {'view': view, 'params': params, 'title': title, 'name': name}
+        self.stack.insert(len(self.stack) if index is None else index, entry)
+        self._manager.register_screen(name, partial(self._views[view], **params), index=index, state=state)
+        return name
+
+    def _show(self, name, mode, animation):
+        """
+        Show the screen of an entry of :attr:`stack`
+
+        :param name: Name of the screen
+        :param mode: Mode of :class:`CupertinoTransition` to show the screen with
+        :param animation: If the screen should be shown with an animation
+        """
+
+        manager = self._manager
+        if animation:
+            if not isinstance(manager.transition, CupertinoTransition):
+                manager.transition = CupertinoTransition()
+            manager.transition.mode = mode
+            manager.current = name
+        else:
+            transition = manager.transition
+            manager.transition = NoTransition()
+            manager.current = name
+            manager.transition = transition
+
+    def push(self, view, params=None, title='', animation=True):
+        """
+        Push a view onto :class:`CupertinoNavigationController`
+
+        :param view: Name of a view registered with :meth:`register_view`
+        :param params: Dictionary of parameters passed to the factory of the view, which must be serializable to
+            JSON for :meth:`save`
+        :param title: Title of the view shown in the navigation bar
+        :param animation: If the view should be pushed with an animation
+        :return: Instance of :class:`~kivy.uix.screenmanager.Screen` of the view
+        """
+
+        name = self._add_entry(view, dict(params or {}), title)
+        if len(self.stack) > 1:
+            self._show(name, 'push', animation)
+        return self._manager.get_screen(name)
+
+    def pop(self, animation=True):
+        """
+        Pop the top view off :class:`CupertinoNavigationController`, unless it is the root view
+
+        :param animation: If the view should be popped with an animation
+        :return: If a view was popped
+        """
+
+        if len(self.stack) < 2:
+            return False
+        entry = self.stack.pop()
+        self._show(self.stack[-1]['name'], 'pop', animation)
+        self._discarded.append(entry['name'])
+        self._trigger_discard()
+        return True
+
+    def pop_to_root(self, animation=True):
+        """
+        Pop all views except the root view off :class:`CupertinoNavigationController`
+
+        :param animation: If the top view should be popped with an animation
+        """
+
+        if len(self.stack) < 2:
+            return
+        self._discarded.extend(entry['name'] for entry in self.stack[1:])
+        del self.stack[1:-1]
+        self.pop(animation)
+
+    def _discard(self, *args):
+        """
+        Remove the screens of popped views once the transition of the screen manager of
+        :class:`CupertinoNavigationController` is complete
+
+        :param args: Arguments of the callback
+        """
+
+        if self._manager.transition.is_active:
+            self._trigger_discard()
+            return
+        while self._discarded:
+            self._manager.unregister_screen(self._discarded.pop())
+
+    def clear(self):
+        """
+        Remove all views from :class:`CupertinoNavigationController`
+        """
+
+        self._manager.current = None
+        self._discarded.extend(entry['name'] for entry in self.stack)
+        del self.stack[:]
+        self._discard()
+
+    def save(self, filename):
+        """
+        Save :attr:`stack` and the state of its screens to a file. The state of a screen is the value returned by its
+        ``save_state()`` method (if it has one), and must be serializable to JSON
+
+        :param filename: Path of the file
+        """
+
+        stack = [[entry['view'], entry['title'], entry['params'], self._manager.get_state(entry['name'])]
+                 for entry in self.stack]
+        # The file is replaced only once it is completely written, so a failed save keeps the previous stack
+        with open(f'{filename}.tmp', 'w') as file:
+            dump({'version': 1, 'stack': stack}, file, separators=(',', ':'))
+        os.replace(f'{filename}.tmp', filename)
+
+    def restore(self, filename):
+        """
+        Restore a stack saved with :meth:`save`, replacing :attr:`stack`. Only the screen of the top view is built,
+        and the screens of the other views are built with their saved state when they are shown again
+
+        :param filename: Path of the file
+        :return: If the stack was restored
+        """
+
+        if not os.path.exists(filename):
+            return False
+        try:
+            with open(filename, 'r') as file:
+                data = load(file)
+            stack = data['stack'] if data.get('version') == 1 else []
+        except (OSError, ValueError, KeyError, AttributeError):
+            stack = []
+        # Every entry is checked before the current stack is cleared, so a corrupt file leaves the stack untouched
+        if not isinstance(stack, list) or not stack or not all(self._is_valid_entry(entry) for entry in stack):
+            Logger.warning(f'CupertinoNavigationController: Unable to restore stack from "{filename}"')
+            return False
+
+        self.clear()
+        # The top view is registered first so it is the only screen built when it becomes the current screen
+        for view, title, params, state in reversed(stack):
+            self._add_entry(view, params, title, state, index=0)
+        return True
+
+    def _is_valid_entry(self, entry):
+        """
+        Check if an entry of a stack saved with :meth:`save` can be restored
+
+        :param entry: The entry, as loaded from the file
+        :return: If :param entry: is a list of a registered view, a title, parameters and a state
+        """
+
+        return (isinstance(entry, list) and len(entry) == 4 and isinstance(entry[0], str) and entry[0] in self._views
+                and isinstance(entry[1], str) and isinstance(entry[2], dict))
@@ -2,18 +2,34 @@
 Swiping allows users to interact with widgets by using hidden actions
 """
 
+from weakref import WeakKeyDictionary
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.stencilview import StencilView
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.widget import Widget
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivycupertino.uix.behavior import CupertinoButtonBehavior
-from kivy.properties import NumericProperty, OptionProperty, BooleanProperty, ColorProperty, StringProperty
+from kivycupertino.uix.gesture import VelocityTracker
+from kivy.properties import NumericProperty, OptionProperty, BooleanProperty, ColorProperty, StringProperty, \
+    ObjectProperty
+from kivy.graphics import InstructionGroup, Rectangle, ScissorPush, ScissorPop, StencilPush, StencilUse, \
+    StencilUnUse, StencilPop
 from kivy.animation import Animation
+from kivy.clock import Clock
 from kivy.lang.builder import Builder
 
 __all__ = [
     'CupertinoSwipe',
-    'CupertinoSwipeAction'
+    'CupertinoSwipeAction',
+    'CupertinoSwipeController'
 ]
 
+_controllers = WeakKeyDictionary()
+"""
+Instances of :class:`CupertinoSwipeController` shared by the instances of :class:`CupertinoSwipe` shown by a
+:class:`~kivy.uix.recycleview.RecycleView`
+"""
+
 Builder.load_string("""
 <CupertinoSwipe>:
     _content: content
@@ -49,9 +65,62 @@ Builder.load_string("""
 """)
 
 
-class CupertinoSwipe(StencilView):
+class CupertinoSwipeController:
     """
-    A widget to add swiping functionality to existing Kivy Cupertino widgets
+    Controller shared by instances of :class:`CupertinoSwipe` so that at most one of them is expanded at a time.
+    Instances of :class:`CupertinoSwipe` shown by a :class:`~kivy.uix.recycleview.RecycleView` share one controller
+    automatically
+
+    **Python**
+
+    .. code-block:: python
+
+       controller = CupertinoSwipeController()
+       CupertinoSwipe(controller=controller)
+       CupertinoSwipe(controller=controller)
+    """
+
+    def __init__(self):
+        """
+        Initialize variables of :class:`CupertinoSwipeController`
+        """
+
+        self._swipe = None
+        self._item = None
+
+    def expanded(self, swipe):
+        """
+        Callback when an instance of :class:`CupertinoSwipe` is expanded, collapsing the one expanded previously
+
+        :param swipe: Expanded instance of :class:`CupertinoSwipe`
+        """
+
+        previous, item = self._swipe, self._item
+        self._swipe, self._item = swipe, swipe._item
+        if previous is None or (previous is swipe and item is swipe._item):
+            return
+
+        if previous is not swipe and previous._item is item:
+            previous.collapse()
+        elif item is not None:
+            item[previous.key_expanded] = None
+
+    def collapsed(self, swipe):
+        """
+        Callback when an instance of :class:`CupertinoSwipe` is collapsed
+
+        :param swipe: Collapsed instance of :class:`CupertinoSwipe`
+        """
+
+        if self._swipe is swipe and self._item is swipe._item:
+            self._swipe = self._item = None
+
+
+class CupertinoSwipe(RecycleDataViewBehavior, Widget):
+    """
+    A widget to add swiping functionality to existing Kivy Cupertino widgets. :class:`CupertinoSwipe` can be used as
+    the :attr:`~kivy.uix.recycleview.RecycleView.viewclass` of a :class:`~kivy.uix.recycleview.RecycleView`, in
+    which case the expanded side is stored in the items of its data
 
     .. image:: ../_static/swipe/demo.gif
     """
@@ -97,17 +166,135 @@ class CupertinoSwipe(StencilView):
            complete_swipe_duration: 1
     """
 
+    controller = ObjectProperty(None, allownone=True)
+    """
+    Instance of :class:`CupertinoSwipeController` collapsing other instances of :class:`CupertinoSwipe` when
+    :class:`CupertinoSwipe` is expanded
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoSwipe(controller=CupertinoSwipeController())
+    """
+
+    clipping = OptionProperty('scissor', options=['scissor', 'stencil'])
+    """
+    How content and actions of :class:`CupertinoSwipe` are clipped to its bounds. ``'scissor'`` clips with a
+    rectangle in window coordinates only while :class:`CupertinoSwipe` is not collapsed, while ``'stencil'`` always
+    clips with the stencil buffer and should be used when :class:`CupertinoSwipe` is rotated or scaled
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoSwipe(clipping='stencil')
+    
+    **KV**
+    
+    .. code-block::
+    
+       CupertinoSwipe:
+           clipping: 'stencil'
+    """
+
+    key_expanded = StringProperty('expanded')
+    """
+    Key of items of the data of a :class:`~kivy.uix.recycleview.RecycleView` storing the expanded side
+    (``'left'``, ``'right'`` or ``None``) of :class:`CupertinoSwipe`
+    """
+
+    _content = ObjectProperty(None, allownone=True)
+    """
+    Cell showing the content of :class:`CupertinoSwipe`
+    """
+
     def __init__(self, **kwargs):
         """
         Callback to initialize variables of :class:`CupertinoSwipe`
         """
 
-        super().__init__(**kwargs)
         self._left_distance = 0
         self._right_distance = 0
         self._last_movement = 0
         self._direction = 0
-        self.bind(right=self._update_actions)
+        self._item = None
+        self._animation = None
+        self._left_actions = []
+        self._right_actions = []
+        self._tracker = VelocityTracker()
+        self._clipped = None
+        self._clip_scroll_views = []
+        self._trigger_clip_area = Clock.create_trigger(self._update_clip_area)
+        self._clip_instructions = ()
+        self._clip_before = InstructionGroup()
+        self._clip_after = InstructionGroup()
+        super().__init__(**kwargs)
+        self.canvas.before.insert(0, self._clip_before)
+        self.canvas.after.add(self._clip_after)
+        self.bind(
+            right=self._update_actions,
+            pos=self._update_clip_area,
+            size=self._update_clip_area,
+            clipping=lambda *args: self._update_clipping(True)
+        )
+        self._update_clipping()
+
+    def refresh_view_attrs(self, rv, index, data):
+        """
+        Callback when :class:`CupertinoSwipe` is bound to an item of the data of a
+        :class:`~kivy.uix.recycleview.RecycleView`
+
+        :param rv: Instance of :class:`~kivy.uix.recycleview.RecycleView` showing :class:`CupertinoSwipe`
+        :param index: Index of the item
+        :param data: Item of the data
+        """
+
+        key_expanded = self.key_expanded
+        super().refresh_view_attrs(rv, index, {key: value for key, value in data.items() if key != key_expanded})
+        if self.controller is None:
+            self.controller = _controllers.setdefault(rv, CupertinoSwipeController())
+        self._item = data
+
+    def refresh_view_layout(self, rv, index, layout, viewport):
+        """
+        Callback when :class:`CupertinoSwipe` is moved or resized by a :class:`~kivy.uix.recycleview.RecycleView`
+
+        :param rv: Instance of :class:`~kivy.uix.recycleview.RecycleView` showing :class:`CupertinoSwipe`
+        :param index: Index of the item shown by :class:`CupertinoSwipe`
+        :param layout: Size and position of :class:`CupertinoSwipe`
+        :param viewport: Visible area of the :class:`~kivy.uix.recycleview.RecycleView`
+        """
+
+        super().refresh_view_layout(rv, index, layout, viewport)
+        self._restore_state()
+
+    def _restore_state(self):
+        """
+        Move the content of :class:`CupertinoSwipe` without animation to the side stored in the item it shows
+        """
+
+        side = self._item.get(self.key_expanded) if self._item is not None else None
+        self._stop_animation()
+        self._direction = 1 if side == 'left' else -1 if side == 'right' else 0
+        distance = self._left_distance if side == 'left' else self._right_distance if side == 'right' else 0
+        self._content.x = self.x + distance
+        self._move_actions()
+
+    def _store_state(self, side):
+        """
+        Store the expanded side of :class:`CupertinoSwipe` in the item it shows and notify :attr:`controller`
+
+        :param side: Expanded side (``'left'``, ``'right'`` or ``None``)
+        """
+
+        if self._item is not None:
+            self._item[self.key_expanded] = side
+        if self.controller is not None:
+            if side is None:
+                self.controller.collapsed(self)
+            else:
+                self.controller.expanded(self)
 
     def _get_content_pos(self):
         """
@@ -116,7 +303,35 @@ class CupertinoSwipe(StencilView):
         :return: The position of the content relative to the widget
         """
 
-        return self.to_local(self._content.x, self._content.y, True)[0]
+        return self._content.x - self.x
+
+    def _animate_content(self, x, on_complete, velocity):
+        """
+        Animate the content of :class:`CupertinoSwipe` to a position
+
+        :param x: Position of the content relative to the widget
+        :param on_complete: Callback when the animation is complete
+        :param velocity: Horizontal velocity of the content when the animation starts
+        """
+
+        self._stop_animation()
+        if velocity:
+            duration = VelocityTracker.duration(x - self._get_content_pos(), velocity, self.complete_swipe_duration)
+            animation = Animation(x=self.x + x, duration=duration, t='out_quad')
+        else:
+            animation = Animation(x=self.x + x, duration=self.complete_swipe_duration, t='out_circ')
+        self._animation = animation
+        animation.bind(on_complete=on_complete)
+        animation.start(self._content)
+
+    def _stop_animation(self):
+        """
+        Stop the animation of the content of :class:`CupertinoSwipe` if one is running
+        """
+
+        if self._animation is not None:
+            self._animation.cancel(self._content)
+            self._animation = None
 
     def _complete_swipe(self, *args):
         """
@@ -125,8 +340,18 @@ class CupertinoSwipe(StencilView):
         :param args: Arguments to reset :class:`CupertinoSwipe`
         """
 
+        self._animation = None
         self._direction = 0
 
+    def _complete_expand(self, *args):
+        """
+        Callback when :class:`CupertinoSwipe` is completely expanded
+
+        :param args: Arguments of the animation
+        """
+
+        self._animation = None
+
     def _update_actions(self, *args):
         """
         Callback to update size and side of the actions of :class:`CupertinoSwipe`
@@ -136,36 +361,116 @@ class CupertinoSwipe(StencilView):
 
         self._left_distance = 0
         self._right_distance = 0
+        left_actions = self._left_actions = []
+        right_actions = self._right_actions = []
 
-        for child in self.children:
+        for child in reversed(self.children):
             if isinstance(child, CupertinoSwipeAction):
                 if child.size_hint_x is not None:
                     child.width = self.width * child.size_hint_x
                 child.x = self.right
                 if child.side == 'left':
+                    left_actions.append([child, child.width])
                     self._left_distance += child.width
                 elif child.side == 'right':
+                    right_actions.append([child, child.width])
                     self._right_distance -= child.width
 
-    def _move_actions(self):
+        # Replace widths with the distance of each action from the edge it is revealed from when fully expanded
+        moved = 0
+        for action in left_actions:
+            moved, action[1] = moved + action[1], self._left_distance - moved
+        moved = 0
+        for action in right_actions:
+            moved, action[1] = moved + action[1], -self._right_distance - moved
+
+    def _update_clipping(self, rebuild=False):
         """
-        Callback to move all actions of :class:`CupertinoSwipe` when swiped
+        Add or remove the instructions clipping :class:`CupertinoSwipe` depending on :attr:`clipping` and if
+        :class:`CupertinoSwipe` is collapsed
+
+        :param rebuild: If the instructions should be recreated even if clipping is still needed
         """
 
-        content_position = self._get_content_pos()
-        moved_left = 0
-        moved_right = 0
+        # The content is not available yet when CupertinoSwipe is created inside a KV rule, so it is collapsed
+        clipped = self.clipping == 'stencil' or (self._content is not None and self._content.x != self.x)
+        if clipped == self._clipped and not rebuild:
+            return
+
+        self._clipped = clipped
+        self._clip_before.clear()
+        self._clip_after.clear()
+        self._clip_instructions = ()
+        for scroll_view in self._clip_scroll_views:
+            scroll_view.unbind(scroll_x=self._trigger_clip_area, scroll_y=self._trigger_clip_area)
+        self._clip_scroll_views = []
 
-        for child in self.children[::-1]:
+        # Actions are outside the bounds of a collapsed CupertinoSwipe, so they are hidden instead of clipped
+        for child in self.children:
             if isinstance(child, CupertinoSwipeAction):
-                if child.side == 'left' and self._direction != -1:
-                    action_position = (self._left_distance - moved_left) * (content_position / self._left_distance)
-                    child.right = self.to_parent(action_position, 0, True)[0]
-                    moved_left += child.width
-                elif child.side == 'right' and self._direction != 1:
-                    action_position = -(self._right_distance + moved_right) * (content_position / self._right_distance)
-                    child.x = self.right - action_position
-                    moved_right += child.width
+                child.opacity = 1 if clipped else 0
+
+        if not clipped:
+            return
+        if self.clipping == 'stencil':
+            self._clip_instructions = (Rectangle(), Rectangle())
+            for instruction in (StencilPush(), self._clip_instructions[0], StencilUse()):
+                self._clip_before.add(instruction)
+            for instruction in (StencilUnUse(), self._clip_instructions[1], StencilPop()):
+                self._clip_after.add(instruction)
+        else:
+            self._clip_instructions = (ScissorPush(),)
+            self._clip_before.add(self._clip_instructions[0])
+            self._clip_after.add(ScissorPop())
+            # Window coordinates change when a parent scrolls without moving CupertinoSwipe. Scroll views apply their
+            # scroll position from a trigger, so the area is updated from a trigger scheduled after theirs
+            parent = self.parent
+            while parent is not None and parent is not parent.parent:
+                if isinstance(parent, ScrollView):
+                    parent.bind(scroll_x=self._trigger_clip_area, scroll_y=self._trigger_clip_area)
+                    self._clip_scroll_views.append(parent)
+                parent = parent.parent
+        self._update_clip_area()
+
+    def _update_clip_area(self, *args):
+        """
+        Callback to update the area :class:`CupertinoSwipe` is clipped to
+
+        :param args: Arguments of the callback
+        """
+
+        if not self._clip_instructions:
+            return
+        if self.clipping == 'stencil':
+            for rectangle in self._clip_instructions:
+                rectangle.pos = self.pos
+                rectangle.size = self.size
+        else:
+            scissor = self._clip_instructions[0]
+            x, y = self.to_window(self.x, self.y)
+            x, y, width, height = round(x), round(y), round(self.width), round(self.height)
+            if (scissor.x, scissor.y, scissor.width, scissor.height) != (x, y, width, height):
+                scissor.x, scissor.y, scissor.width, scissor.height = x, y, width, height
+
+    def _move_actions(self):
+        """
+        Callback to move all actions of :class:`CupertinoSwipe` when swiped
+        """
+
+        content_position = self._content.x - self.x
+        if (content_position != 0) is not self._clipped and self.clipping == 'scissor':
+            self._update_clipping()
+
+        if self._direction != -1 and self._left_distance:
+            ratio = content_position / self._left_distance
+            x = self.x
+            for child, offset in self._left_actions:
+                child.right = x + offset * ratio
+        if self._direction != 1 and self._right_distance:
+            ratio = content_position / self._right_distance
+            right = self.right
+            for child, offset in self._right_actions:
+                child.x = right - offset * ratio
 
     def on_touch_down(self, touch):
         """
@@ -177,6 +482,8 @@ class CupertinoSwipe(StencilView):
         if self.collide_point(*touch.pos):
             touch.grab(self)
             self._last_movement = touch.x
+            self._tracker.reset()
+            self._tracker.add_touch(touch)
         return super().on_touch_down(touch)
 
     def on_touch_up(self, touch):
@@ -188,14 +495,16 @@ class CupertinoSwipe(StencilView):
 
         if touch.grab_current is self:
             touch.ungrab(self)
-            position = self._get_content_pos()
+            self._tracker.add_touch(touch)
+            velocity = self._tracker.velocity_x()
+            position = VelocityTracker.project(self._get_content_pos(), velocity)
 
             if position > self._left_distance - position and self._direction == 1:
-                self.expand('left')
+                self.expand('left', velocity)
             elif position < self._right_distance - position and self._direction == -1:
-                self.expand('right')
+                self.expand('right', velocity)
             else:
-                self.collapse()
+                self.collapse(velocity)
         return super().on_touch_up(touch)
 
     def on_touch_move(self, touch):
@@ -206,15 +515,17 @@ class CupertinoSwipe(StencilView):
         """
 
         if touch.grab_current is self:
-            Animation.cancel_all(self._content)
+            self._stop_animation()
+            self._tracker.add_touch(touch)
             distance = touch.x - self._last_movement
-            position = self._get_content_pos()
+            position = self._content.x - self.x
             if (distance > 0 and position < self._left_distance) or (distance < 0 and position > self._right_distance):
                 if self._direction == 0 and not self.is_collapsed():
                     self._direction = position / abs(position)
                 self._content.x += distance * (
                     0.2 if position != 0 and position / abs(position) != self._direction else 1)
                 self._last_movement = touch.x
+            return True
         return super().on_touch_move(touch)
 
     def add_widget(self, widget, index=0, canvas=None):
@@ -230,11 +541,13 @@ class CupertinoSwipe(StencilView):
             super().add_widget(widget, index, canvas)
         elif isinstance(widget, CupertinoSwipeAction):
             super().add_widget(widget, index, canvas)
+            widget.opacity = 1 if self._clipped else 0
             widget.bind(side=self._update_actions, size_hint_x=self._update_actions)
             self.bind(height=widget.setter('height'), y=widget.setter('y'))
             self._update_actions()
         else:
-            self._content.add_widget(widget, index, canvas)
+            # The first child is the content, which is not yet available as _content while KV rules are applied
+            self.children[-1].add_widget(widget, index, canvas)
 
     def is_collapsed(self):
         """
@@ -245,30 +558,32 @@ class CupertinoSwipe(StencilView):
 
         return self._get_content_pos() == 0
 
-    def collapse(self):
+    def collapse(self, velocity=0):
         """
         Callback to reset :class:`CupertinoSwipe` so no actions are visible
 
         .. image:: ../_static/swipe/collapse.gif
+
+        :param velocity: Horizontal velocity in pixels per second to start collapsing at
         """
 
-        animation = Animation(x=self.to_parent(0, 0, True)[0], duration=self.complete_swipe_duration, t='out_circ')
-        animation.bind(on_complete=self._complete_swipe)
-        animation.start(self._content)
+        self._animate_content(0, self._complete_swipe, velocity)
+        self._store_state(None)
 
-    def expand(self, side):
+    def expand(self, side, velocity=0):
         """
         Callback to completely open a specified side :class:`CupertinoSwipe`
 
         .. image:: ../_static/swipe/expand.gif
 
         :param side: The side of :class:`CupertinoSwipe` to expand (``'left'`` or ``'right'``)
+        :param velocity: Horizontal velocity in pixels per second to start expanding at
         """
 
         if side in ['left', 'right']:
-            x = self.to_parent(self._left_distance if side == 'left' else self._right_distance, 0, True)[0]
-            animation = Animation(x=x, duration=self.complete_swipe_duration, t='out_circ')
-            animation.start(self._content)
+            self._animate_content(self._left_distance if side == 'left' else self._right_distance,
+                                  self._complete_expand, velocity)
+            self._store_state(side)
         else:
             raise ValueError(f"Unknown side '{side}'")
 
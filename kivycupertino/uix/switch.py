@@ -4,8 +4,9 @@ Switches allow users to toggle options
 
 from kivy.uix.behaviors.button import ButtonBehavior
 from kivy.uix.widget import Widget
-from kivy.properties import BooleanProperty, NumericProperty, ColorProperty
+from kivy.properties import BooleanProperty, NumericProperty, ColorProperty, ObjectProperty
 from kivy.animation import Animation
+from kivy.clock import Clock
 from kivy.lang.builder import Builder
 from kivy.metrics import dp
 
@@ -33,7 +34,6 @@ Builder.load_string("""
         id: thumb
         height: dp(root.height-root._padding)
         width: self.height
-        x: root.x+root._padding
         center_y: root.y+(root.height/2)
         
         canvas.before:
@@ -175,6 +175,11 @@ class CupertinoSwitch(ButtonBehavior, Widget):
            thumb_padding: 0.1
     """
 
+    _thumb = ObjectProperty(None, allownone=True)
+    """
+    Thumb of :class:`CupertinoSwitch`
+    """
+
     def __init__(self, **kwargs):
         """
         Initialize :class:`CupertinoSwitch` and register events
@@ -182,8 +187,41 @@ class CupertinoSwitch(ButtonBehavior, Widget):
         :param kwargs: Keyword arguments of :class:`CupertinoSwitch`
         """
 
+        self._trigger_snap = Clock.create_trigger(self._snap, -1)
         super().__init__(**kwargs)
-        self.bind(pos=lambda instance, value: self.on_toggled(instance, self.toggled))
+        self.bind(
+            pos=self._trigger_snap,
+            size=self._trigger_snap,
+            _padding=self._trigger_snap,
+            color_toggled=self._trigger_snap,
+            color_untoggled=self._trigger_snap
+        )
+        self._trigger_snap()
+
+    def _get_thumb_x(self, state):
+        """
+        Get the horizontal position of the thumb of :class:`CupertinoSwitch`
+
+        :param state: If :class:`CupertinoSwitch` is toggled
+        :return: Horizontal position of the thumb
+        """
+
+        if state:
+            return self.x + self.width - self._thumb.width - self._padding
+        return self.x + self._padding
+
+    def _snap(self, *args):
+        """
+        Move the thumb and set the background color of :class:`CupertinoSwitch` to match its state without an
+        animation, at most once per frame when it is moved, resized or recolored
+
+        :param args: Arguments of the callback
+        """
+
+        Animation.cancel_all(self, '_background_color')
+        Animation.cancel_all(self._thumb, 'x')
+        self._background_color = self.color_toggled if self.toggled else self.color_untoggled
+        self._thumb.x = self._get_thumb_x(self.toggled)
 
     def on_toggled(self, instance, state):
         """
@@ -193,15 +231,13 @@ class CupertinoSwitch(ButtonBehavior, Widget):
         :param state: If :class:`CupertinoSwitch` is toggled
         """
 
-        if state:
-            color_animation = Animation(_background_color=self.color_toggled, duration=self.switch_duration)
-            thumb_animation = Animation(x=self.x + self.width - self._thumb.width - self._padding,
-                                        duration=self.switch_duration)
-        else:
-            color_animation = Animation(_background_color=self.color_untoggled, duration=self.switch_duration)
-            thumb_animation = Animation(x=self.x + self._padding, duration=self.switch_duration)
-        color_animation.start(self)
-        thumb_animation.start(self._thumb)
+        if self._thumb is None:
+            return
+        Animation.cancel_all(self, '_background_color')
+        Animation.cancel_all(self._thumb, 'x')
+        Animation(_background_color=self.color_toggled if state else self.color_untoggled,
+                  duration=self.switch_duration).start(self)
+        Animation(x=self._get_thumb_x(state), duration=self.switch_duration).start(self._thumb)
 
     def on_touch_move(self, touch):
         """
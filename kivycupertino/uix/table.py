@@ -2,18 +2,50 @@
 Tables help organize data and information for users to view and interact with
 """
 
+import asyncio
+from bisect import bisect_left, bisect_right
+from threading import Event, Thread
+from time import perf_counter
 from kivy.uix.relativelayout import RelativeLayout
 from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recyclelayout import RecycleLayout
+from kivycupertino.uix.label import CupertinoLabel
 from kivycupertino.uix.behavior import CupertinoButtonBehavior
-from kivy.properties import ColorProperty, NumericProperty, BooleanProperty, StringProperty
+from kivy.event import EventDispatcher
+from kivy.properties import ColorProperty, NumericProperty, BooleanProperty, StringProperty, ListProperty, \
+    ObjectProperty
+from kivy.core.text import Label as CoreLabel
+from kivy.metrics import Metrics, dp
+from kivy.factory import Factory
+from kivy.clock import Clock
+from kivy.logger import Logger
 from kivy.lang.builder import Builder
 
 __all__ = [
     'CupertinoTableCell',
     'CupertinoClickableTableCell',
-    'CupertinoTableGroup'
+    'CupertinoTextTableCell',
+    'CupertinoTableLoadingCell',
+    'CupertinoTableHeader',
+    'CupertinoTableGroup',
+    'CupertinoTableLayout',
+    'CupertinoTableView',
+    'CupertinoTableIndex',
+    'CupertinoPagedDataSource'
 ]
 
+_MEASURE_BUDGET = 0.004
+"""
+Maximum time (in seconds) spent measuring row heights of :class:`CupertinoTableView` per frame
+"""
+
+_CACHED_WIDTHS = 2
+"""
+Amount of widths of :class:`CupertinoTableView` that measured row heights are kept for
+"""
+
 Builder.load_string("""
 <CupertinoTableCell>:
     canvas.before:
@@ -39,6 +71,58 @@ Builder.load_string("""
         width: self.height
         pos_hint: {'right': 0.97, 'center_y': 0.5}
 
+<CupertinoTextTableCell>:
+    CupertinoLabel:
+        text: root.text
+        font_name: root.font_name
+        font_size: root.font_size
+        color: root.text_color
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.size
+        size_hint: None, None
+        size: root.width - root.padding[0] * 2, root.height
+        pos: root.padding[0], 0
+
+<CupertinoTableLoadingCell>:
+    CupertinoActivityIndicator:
+        playing: root.parent is not None
+        size_hint: None, None
+        size: root.height / 2, root.height / 2
+        pos_hint: {'center_x': 0.5, 'center_y': 0.5}
+
+<CupertinoTableHeader>:
+    canvas.before:
+        Color:
+            rgba: self.color
+        Rectangle:
+            size: self.size
+            pos: 0, 0
+    
+    CupertinoLabel:
+        text: (' ' * 4) + root.text
+        font_size: '12sp'
+        text_size: self.size
+        halign: 'left'
+        valign: 'middle'
+        color: root.text_color
+        size_hint: None, None
+        size: root.size
+        pos: 0, 0
+
+<CupertinoTableView>:
+    viewclass: 'CupertinoTextTableCell'
+    key_viewclass: 'viewclass'
+    
+    CupertinoTableLayout:
+        size_hint_y: None
+        default_size_hint: 1, None
+
+<CupertinoTableIndex>:
+    orientation: 'vertical'
+    size_hint_x: None
+    width: dp(20)
+
 <CupertinoTableGroup>:
     orientation: 'vertical'
     
@@ -201,6 +285,154 @@ class CupertinoClickableTableCell(CupertinoButtonBehavior, CupertinoTableCell):
     """
 
 
+class CupertinoTextTableCell(RecycleDataViewBehavior, CupertinoTableCell):
+    """
+    iOS style Cell showing wrapped text. :class:`CupertinoTextTableCell` is the default
+    :attr:`~CupertinoTableView.viewclass` of :class:`CupertinoTableView` and takes its font and padding from it
+    """
+
+    text = StringProperty(' ')
+    """
+    Text of :class:`CupertinoTextTableCell`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTextTableCell(text='Hello World')
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTextTableCell:
+           text: 'Hello World'
+    """
+
+    text_color = ColorProperty([0, 0, 0, 1])
+    """
+    Color of :attr:`text` of :class:`CupertinoTextTableCell`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTextTableCell(text_color=(1, 0, 0, 1))
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTextTableCell:
+           text_color: 1, 0, 0, 1
+    """
+
+    font_name = StringProperty('San Francisco')
+    """
+    Font of :attr:`text` of :class:`CupertinoTextTableCell`
+    """
+
+    font_size = NumericProperty('15sp')
+    """
+    Size of the font of :attr:`text` of :class:`CupertinoTextTableCell`
+    """
+
+    padding = ListProperty([dp(15), dp(10)])
+    """
+    Horizontal and vertical padding around :attr:`text` of :class:`CupertinoTextTableCell`
+    """
+
+    def refresh_view_attrs(self, rv, index, data):
+        """
+        Callback when :class:`CupertinoTextTableCell` is bound to an item of :attr:`~CupertinoTableView.data`
+
+        :param rv: Instance of :class:`CupertinoTableView` showing :class:`CupertinoTextTableCell`
+        :param index: Index of the item in :attr:`~CupertinoTableView.data`
+        :param data: Item of :attr:`~CupertinoTableView.data`
+        """
+
+        if isinstance(rv, CupertinoTableView):
+            self.font_name = rv.font_name
+            self.font_size = rv.font_size
+            self.padding = rv.row_padding
+        super().refresh_view_attrs(rv, index, data)
+
+
+class CupertinoTableLoadingCell(CupertinoTableCell):
+    """
+    Cell of :class:`CupertinoTableView` showing a :class:`~kivycupertino.uix.indicator.CupertinoActivityIndicator`
+    while more rows are loaded by :class:`CupertinoPagedDataSource`
+    """
+
+
+class CupertinoTableHeader(RecycleDataViewBehavior, RelativeLayout):
+    """
+    iOS style section header of :class:`CupertinoTableView`. Items of :attr:`~CupertinoTableView.data` with
+    ``'viewclass': 'CupertinoTableHeader'`` start a new section, whose header stays pinned to the top of
+    :class:`CupertinoTableView` while the section is scrolled
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoTableView(data=[{'viewclass': 'CupertinoTableHeader', 'text': 'Section'}, {'text': 'Row'}])
+    """
+
+    text = StringProperty(' ')
+    """
+    Text of :class:`CupertinoTableHeader`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableHeader(text='Example Section')
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableHeader:
+           text: 'Example Section'
+    """
+
+    text_color = ColorProperty([0.6, 0.6, 0.6, 1])
+    """
+    Color of :attr:`text` of :class:`CupertinoTableHeader`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableHeader(text_color=(1, 0, 0, 1))
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableHeader:
+           text_color: 1, 0, 0, 1
+    """
+
+    color = ColorProperty([0.95, 0.95, 0.97, 1])
+    """
+    Background color of :class:`CupertinoTableHeader`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableHeader(color=(1, 0, 0, 1))
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableHeader:
+           color: 1, 0, 0, 1
+    """
+
+
 class CupertinoTableGroup(BoxLayout):
     """
     iOS style table group
@@ -271,3 +503,1180 @@ class CupertinoTableGroup(BoxLayout):
                     largest = index
         self.children[smallest]._upper_border = 1
         self.children[largest]._lower_border = 1
+
+
+class CupertinoTableLayout(RecycleLayout):
+    """
+    Layout of the rows of :class:`CupertinoTableView`, keeping an index of the offset of every row from the top of
+    the table so visible rows are found in logarithmic time
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoTableLayout`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoTableLayout`
+        """
+
+        super().__init__(**kwargs)
+        self._offsets = [0]
+        self._sections = []
+        self._section_offsets = []
+
+    def attach_recycleview(self, rv):
+        """
+        Callback when :class:`CupertinoTableLayout` is added to :class:`CupertinoTableView`
+
+        :param rv: Instance of :class:`CupertinoTableView`
+        """
+
+        super().attach_recycleview(rv)
+        if rv:
+            self.fbind('width', rv.refresh_from_layout)
+
+    def detach_recycleview(self):
+        """
+        Callback when :class:`CupertinoTableLayout` is removed from :class:`CupertinoTableView`
+        """
+
+        rv = self.recycleview
+        if rv:
+            self.funbind('width', rv.refresh_from_layout)
+        super().detach_recycleview()
+
+    def compute_sizes_from_data(self, data, flags):
+        """
+        Create the sizing information of every item of :attr:`~CupertinoTableView.data`
+
+        :param data: Data of :class:`CupertinoTableView`
+        :param flags: Changes of :param data: since the last call
+        """
+
+        super().compute_sizes_from_data(data, flags)
+        for opt in self.view_opts:
+            opt['width_none'] = opt['height_none'] = False
+
+    def compute_layout(self, data, flags):
+        """
+        Compute the position of every row of :class:`CupertinoTableView` from the heights given by it
+
+        :param data: Data of :class:`CupertinoTableView`
+        :param flags: Changes of the layout since the last call
+        """
+
+        super().compute_layout(data, flags)
+        if self._changed_views is None:
+            return
+
+        get_height = self.recycleview._get_row_height
+        width = self.width
+        offsets = self._offsets = [0] * (len(data) + 1)
+        sections = self._sections = []
+        section_offsets = self._section_offsets = []
+        headers = {}
+        top = 0
+        for index, opt in enumerate(self.view_opts):
+            viewclass = opt['viewclass']
+            if viewclass not in headers:
+                cls = Factory.get(viewclass) if isinstance(viewclass, str) else viewclass
+                headers[viewclass] = issubclass(cls, CupertinoTableHeader)
+            if headers[viewclass]:
+                sections.append(index)
+                section_offsets.append(top)
+            opt['size'] = [width, get_height(index, data[index], headers[viewclass])]
+            top += opt['size'][1]
+            offsets[index + 1] = top
+
+        self.height = top
+        x, y = self.pos
+        for index, opt in enumerate(self.view_opts):
+            opt['pos'] = [x, y + top - offsets[index + 1]]
+        self.remove_views()
+
+    def get_view_index_at(self, pos):
+        """
+        Get the index of the row at a position
+
+        :param pos: Position in coordinates of :class:`CupertinoTableLayout`
+        :return: Index of the row at :param pos:
+        """
+
+        offsets = self._offsets
+        index = bisect_right(offsets, self.top - pos[1]) - 1
+        return min(max(index, 0), len(offsets) - 2)
+
+    def compute_visible_views(self, data, viewport):
+        """
+        Get the indices of the rows visible in a viewport
+
+        :param data: Data of :class:`CupertinoTableView`
+        :param viewport: Viewport in coordinates of :class:`CupertinoTableLayout`
+        :return: Range of visible indices
+        """
+
+        if not data or len(self._offsets) != len(data) + 1:
+            return []
+
+        x, y, w, h = viewport
+        offsets = self._offsets
+        first = bisect_right(offsets, self.top - y - h) - 1
+        last = bisect_left(offsets, self.top - y) - 1
+        return range(max(first, 0), min(last, len(data) - 1) + 1)
+
+    def goto_view(self, index):
+        """
+        Scroll :class:`CupertinoTableView` so the row at an index is at its top
+
+        :param index: Index of the row
+        """
+
+        self.recycleview.scroll_to_index(index)
+
+
+class CupertinoTableView(RecycleView):
+    """
+    iOS style Table View that only creates widgets for the rows currently visible. Rows are described by dictionaries
+    in :attr:`data` whose keys are properties of :attr:`viewclass`
+
+    **Python**
+
+    .. code-block:: python
+
+       CupertinoTableView(data=[{'text': str(i)} for i in range(10000)])
+
+    **KV**
+
+    .. code-block::
+
+       CupertinoTableView:
+           data: [{'text': str(i)} for i in range(10000)]
+    """
+
+    row_height = NumericProperty(dp(44))
+    """
+    Height of rows of :class:`CupertinoTableView`. When :attr:`variable_height` is ``True``, this is the minimum
+    height of a row and the estimated height of a row which has not yet been measured
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableView(row_height=60)
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableView:
+           row_height: 60
+    """
+
+    variable_height = BooleanProperty(False)
+    """
+    If the height of every row of :class:`CupertinoTableView` should fit its wrapped text. Heights are measured
+    ahead of layout, a few rows per frame, without rendering the text, and are cached by item and width
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableView(variable_height=True)
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableView:
+           variable_height: True
+    """
+
+    key_id = StringProperty('id')
+    """
+    Key of items of :attr:`data` identifying them in the cache of measured row heights. Items without it are
+    identified by their index, so their measured heights are discarded whenever :attr:`data` changes other than by
+    appending items
+    """
+
+    key_text = StringProperty('text')
+    """
+    Key of items of :attr:`data` holding the text measured when :attr:`variable_height` is ``True``
+    """
+
+    font_name = StringProperty('San Francisco')
+    """
+    Font of the text of rows of :class:`CupertinoTableView`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableView(font_name='New York')
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableView:
+           font_name: 'New York'
+    """
+
+    font_size = NumericProperty('15sp')
+    """
+    Size of the font of the text of rows of :class:`CupertinoTableView`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableView(font_size='20sp')
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableView:
+           font_size: '20sp'
+    """
+
+    row_padding = ListProperty([dp(15), dp(10)])
+    """
+    Horizontal and vertical padding around the text of rows of :class:`CupertinoTableView`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableView(row_padding=(20, 5))
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableView:
+           row_padding: 20, 5
+    """
+
+    header_height = NumericProperty(dp(35))
+    """
+    Height of instances of :class:`CupertinoTableHeader` in :class:`CupertinoTableView`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableView(header_height=50)
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableView:
+           header_height: 50
+    """
+
+    sticky_headers = BooleanProperty(True)
+    """
+    If the :class:`CupertinoTableHeader` of the section at the top of :class:`CupertinoTableView` stays pinned
+    while the section is scrolled
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableView(sticky_headers=False)
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableView:
+           sticky_headers: False
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoTableView`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoTableView`
+        """
+
+        self._height_cache = {}
+        self._metrics_label = None
+        self._measure_cursor = 0
+        self._measure_remaining = 0
+        self._trigger_measure = Clock.create_trigger(self._measure_rows)
+        self._anchor = None
+        self._anchor_index = 0
+        self._layout_data = None
+        self._relayout = False
+        self._header_pool = {}
+        self._pinned_header = None
+        self._pinned_item = None
+        viewclass = kwargs.pop('viewclass', None)
+        data = kwargs.pop('data', None)
+        super().__init__(**kwargs)
+        if viewclass is not None:
+            self.viewclass = viewclass
+        if data is not None:
+            self.data = data
+
+        self.bind(
+            width=lambda *args: self._start_measuring(),
+            variable_height=lambda *args: self.invalidate_row_heights(),
+            font_name=lambda *args: self.invalidate_row_heights(),
+            font_size=lambda *args: self.invalidate_row_heights(),
+            row_padding=lambda *args: self.invalidate_row_heights(),
+            row_height=lambda *args: self.invalidate_row_heights(),
+            header_height=lambda *args: self.refresh_from_layout(),
+            sticky_headers=lambda *args: self._update_pinned_header()
+        )
+        Metrics.bind(fontscale=self._on_fontscale)
+
+    def _on_fontscale(self, instance, value):
+        """
+        Callback when the font scale of the system (dynamic type) changes
+
+        :param instance: Instance of :class:`~kivy.metrics.MetricsBase`
+        :param value: New font scale
+        """
+
+        self.invalidate_row_heights()
+
+    def _get_item_id(self, index, item):
+        """
+        Get the identifier of an item of :attr:`data` in the cache of measured row heights
+
+        :param index: Index of the item
+        :param item: Item of :attr:`data`
+        :return: Identifier of :param item:, or a tuple of ``None`` and :param index: if it has no :attr:`key_id`
+        """
+
+        return item[self.key_id] if self.key_id in item else (None, index)
+
+    def _is_header(self, item):
+        """
+        Check if an item of :attr:`data` is shown by a :class:`CupertinoTableHeader`
+
+        :param item: Item of :attr:`data`
+        :return: If :param item: is a section header
+        """
+
+        viewclass = item.get(self.key_viewclass) if self.key_viewclass else None
+        if isinstance(viewclass, str):
+            viewclass = Factory.get(viewclass)
+        return viewclass is not None and issubclass(viewclass, CupertinoTableHeader)
+
+    def _get_row_height(self, index, item, header=False):
+        """
+        Get the height of a row, using its measured height if available or else :attr:`row_height`
+
+        :param index: Index of the row
+        :param item: Item of :attr:`data` shown by the row
+        :param header: If the row is a :class:`CupertinoTableHeader`
+        :return: Height of the row
+        """
+
+        if 'height' in item:
+            return item['height']
+        elif 'size' in item:
+            return item['size'][1]
+        elif header:
+            return self.header_height
+        elif self.variable_height and self.key_text in item:
+            return self._height_cache.get(self.width, {}).get(self._get_item_id(index, item), self.row_height)
+        return self.row_height
+
+    def _measure_text(self, text):
+        """
+        Measure the height of a row showing text without rendering it to a texture
+
+        :param text: Text of the row
+        :return: Height of the row
+        """
+
+        label = self._metrics_label
+        label.text = text
+        return max(label.render()[1] + self.row_padding[1] * 2, self.row_height)
+
+    def _start_measuring(self):
+        """
+        Start measuring the heights of rows of :class:`CupertinoTableView` for its current width, starting at the
+        first visible row
+        """
+
+        if not self.variable_height or self.width <= 0:
+            return
+
+        cache = self._height_cache
+        if self.width not in cache:
+            cache[self.width] = {}
+            while len(cache) > _CACHED_WIDTHS:
+                del cache[next(iter(cache))]
+
+        self._metrics_label = CoreLabel(
+            font_name=self.font_name,
+            font_size=self.font_size,
+            text_size=(max(self.width - self.row_padding[0] * 2, 1), None)
+        )
+        self._measure_cursor = self._anchor_index
+        self._measure_remaining = len(self.data or [])
+        self._trigger_measure()
+
+    def _measure_rows(self, *args):
+        """
+        Measure the heights of rows of :class:`CupertinoTableView` not yet in the cache, stopping after
+        :data:`_MEASURE_BUDGET` seconds and continuing on the next frame
+        """
+
+        data = self.data
+        if not self.variable_height or not data:
+            return
+
+        cache = self._height_cache.setdefault(self.width, {})
+        key_text = self.key_text
+        deadline = perf_counter() + _MEASURE_BUDGET
+        measured = False
+        index = self._measure_cursor % len(data)
+
+        while self._measure_remaining > 0 and perf_counter() < deadline:
+            item = data[index]
+            item_id = self._get_item_id(index, item)
+            if key_text in item and item_id not in cache and not self._is_header(item):
+                cache[item_id] = self._measure_text(item[key_text])
+                measured = True
+            self._measure_remaining -= 1
+            index = (index + 1) % len(data)
+
+        self._measure_cursor = index
+        if measured:
+            self.refresh_from_layout()
+        if self._measure_remaining > 0:
+            self._trigger_measure()
+
+    def invalidate_row_heights(self):
+        """
+        Discard all measured row heights of :class:`CupertinoTableView` and measure them again. This is done
+        automatically when the font or the font scale of the system changes, and should be called when the text of
+        an item of :attr:`data` changes without its identifier changing
+        """
+
+        self._height_cache.clear()
+        self.refresh_from_layout()
+        self._start_measuring()
+
+    def refresh_from_data(self, *args, **kwargs):
+        """
+        Callback when :attr:`data` of :class:`CupertinoTableView` changes
+
+        :param args: Arguments of the change
+        :param kwargs: Keyword arguments of the change
+        """
+
+        if 'appended' not in kwargs:
+            # Items inserted, removed or replaced move other items to different indices, so heights cached by index
+            # would apply to the wrong rows
+            for cache in self._height_cache.values():
+                for item_id in [item_id for item_id in cache if isinstance(item_id, tuple) and item_id[0] is None]:
+                    del cache[item_id]
+        super().refresh_from_data(*args, **kwargs)
+        self._start_measuring()
+
+    def refresh_views(self, *args):
+        """
+        Update the visible rows of :class:`CupertinoTableView` and remember the first of them so it stays in place
+        when the heights of rows change
+        """
+
+        super().refresh_views(*args)
+        self._layout_data = self.data
+        self._save_anchor()
+        self._update_pinned_header()
+
+    def _save_anchor(self, data=None):
+        """
+        Remember the row at the top of the visible area of :class:`CupertinoTableView` and how far it is scrolled
+
+        :param data: Items the rows are laid out for (:attr:`data` by default)
+        """
+
+        offsets = self.layout_manager._offsets if self.layout_manager is not None else [0]
+        data = self.data if data is None else data
+        if len(offsets) < 2 or len(offsets) != len(data) + 1:
+            self._anchor = None
+            return
+
+        top = self._get_scroll_top()
+        index = min(max(bisect_right(offsets, top) - 1, 0), len(data) - 1)
+        self._anchor = (data[index], top - offsets[index])
+        self._anchor_index = index
+
+    def _update_pinned_header(self):
+        """
+        Pin the :class:`CupertinoTableHeader` of the section at the top of :class:`CupertinoTableView`, pushing it
+        up as the header of the next section reaches it. The pinned header is drawn on the canvas of the layout, so
+        it is clipped with the rows, and is taken from a pool of headers so no widgets are created while scrolling
+        """
+
+        lm = self.layout_manager
+        data = self.data
+        if not self.sticky_headers or lm is None or not lm._sections or len(lm._offsets) != len(data) + 1:
+            self._hide_pinned_header()
+            return
+
+        top = self._get_scroll_top()
+        section = bisect_right(lm._section_offsets, top) - 1
+        if section < 0:
+            self._hide_pinned_header()
+            return
+
+        index = lm._sections[section]
+        header = self._show_pinned_header(index, data[index], lm.view_opts[index]['viewclass'])
+        height = lm.view_opts[index]['size'][1]
+        y = lm.top - top - height
+        if section + 1 < len(lm._sections):
+            y += max(height - (lm._section_offsets[section + 1] - top), 0)
+        header.size = lm.width, height
+        header.pos = lm.x, y
+
+    def _show_pinned_header(self, index, item, viewclass):
+        """
+        Get the pinned :class:`CupertinoTableHeader`, binding it to an item of :attr:`data` if it shows a
+        different one
+
+        :param index: Index of the item
+        :param item: Item of :attr:`data` of the header
+        :param viewclass: Class of the header
+        :return: Pinned :class:`CupertinoTableHeader`
+        """
+
+        header = self._pinned_header
+        if header is not None and header.__class__ is not viewclass:
+            self._hide_pinned_header()
+            header = None
+
+        if header is None:
+            pool = self._header_pool.setdefault(viewclass, [])
+            header = pool.pop() if pool else viewclass()
+            self.layout_manager.canvas.after.add(header.canvas)
+            self._pinned_header = header
+
+        if self._pinned_item is not item:
+            header.refresh_view_attrs(self, index, item)
+            self._pinned_item = item
+        return header
+
+    def _hide_pinned_header(self):
+        """
+        Remove the pinned :class:`CupertinoTableHeader` and return it to the pool of headers
+        """
+
+        header = self._pinned_header
+        if header is not None:
+            self.layout_manager.canvas.after.remove(header.canvas)
+            self._header_pool.setdefault(header.__class__, []).append(header)
+            self._pinned_header = self._pinned_item = None
+
+    def save_viewport(self):
+        """
+        Callback before the rows of :class:`CupertinoTableView` are laid out again
+        """
+
+        if not self._relayout:
+            self._relayout = True
+            if not self._refresh_flags['data']:
+                self._save_anchor()
+            elif self._layout_data is not None and self._layout_data is not self.data:
+                # The rows are still laid out for the replaced data, which may have been scrolled in the same frame
+                # as it was replaced, so the anchor is saved again for the current scroll position
+                self._save_anchor(self._layout_data)
+
+    def restore_viewport(self):
+        """
+        Callback after the rows of :class:`CupertinoTableView` are laid out again, scrolling so the row that was
+        previously at the top stays in place
+        """
+
+        relayout, self._relayout = self._relayout, False
+        if not relayout or self._anchor is None:
+            return
+
+        data = self.data
+        item, delta = self._anchor
+        index = self._anchor_index
+        if index >= len(data) or data[index] is not item:
+            index = next((i for i, other in enumerate(data) if other is item), None)
+            if index is None:
+                return
+
+        self._set_scroll_top(self.layout_manager._offsets[index] + delta)
+
+    def _get_scroll_top(self):
+        """
+        Get the distance from the top of the rows of :class:`CupertinoTableView` to the top of the visible area
+
+        :return: Distance from the top of the rows
+        """
+
+        scrollable = self.layout_manager.height - self.height
+        return max(scrollable, 0) * (1 - min(max(self.scroll_y, 0), 1))
+
+    def _set_scroll_top(self, top):
+        """
+        Scroll :class:`CupertinoTableView` so the visible area starts a certain distance from the top of its rows
+
+        :param top: Distance from the top of the rows
+        """
+
+        scrollable = self.layout_manager.height - self.height
+        scroll_y = 1 - top / scrollable if scrollable > 0 else 1
+        self.scroll_y = min(max(scroll_y, 0), 1)
+        self._update_effect_y_bounds()
+
+    def scroll_to_index(self, index):
+        """
+        Scroll :class:`CupertinoTableView` so the row at an index is at the top of the visible area
+
+        :param index: Index of the row in :attr:`data`
+        """
+
+        if self.layout_manager is None:
+            return
+
+        offsets = self.layout_manager._offsets
+        if len(offsets) > 1:
+            self._set_scroll_top(offsets[min(max(index, 0), len(offsets) - 2)])
+
+
+class CupertinoTableIndex(BoxLayout):
+    """
+    iOS style index of :class:`CupertinoTableView`, usually placed on its right edge. Touching or scrubbing a letter
+    scrolls :attr:`table` to the first row starting with it, using a jump table computed once whenever the
+    :attr:`~CupertinoTableView.data` of :attr:`table` changes
+
+    **Python**
+
+    .. code-block:: python
+
+       table = CupertinoTableView(data=[{'text': name} for name in sorted(contacts)])
+       CupertinoTableIndex(table=table)
+    """
+
+    table = ObjectProperty(None, allownone=True)
+    """
+    Instance of :class:`CupertinoTableView` scrolled by :class:`CupertinoTableIndex`
+    """
+
+    letters = ListProperty(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ#'))
+    """
+    Letters shown on :class:`CupertinoTableIndex`. Rows starting with a character not in :attr:`letters` belong
+    to ``'#'``
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableIndex(letters=['A', 'B', 'C'])
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableIndex:
+           letters: ['A', 'B', 'C']
+    """
+
+    color = ColorProperty([0.05, 0.5, 1, 1])
+    """
+    Color of :attr:`letters` of :class:`CupertinoTableIndex`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableIndex(color=(1, 0, 0, 1))
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableIndex:
+           color: 1, 0, 0, 1
+    """
+
+    font_size = NumericProperty('11sp')
+    """
+    Size of the font of :attr:`letters` of :class:`CupertinoTableIndex`
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoTableIndex(font_size='15sp')
+   
+    **KV**
+   
+    .. code-block::
+    
+       CupertinoTableIndex:
+           font_size: '15sp'
+    """
+
+    key_text = StringProperty('text')
+    """
+    Key of items of :attr:`~CupertinoTableView.data` holding the text whose first character is indexed
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoTableIndex`
+
+        :param kwargs: Keyword arguments for :class:`CupertinoTableIndex`
+        """
+
+        self._jumps = []
+        self._letter = None
+        self._bound_model = None
+        self._trigger_jumps = Clock.create_trigger(self._compute_jumps)
+        super().__init__(**kwargs)
+        self.bind(key_text=self._trigger_jumps, font_size=self._update_labels, color=self._update_labels)
+        self.on_letters(self, self.letters)
+
+    def on_letters(self, instance, letters):
+        """
+        Callback when :attr:`letters` is changed
+
+        :param instance: Instance of :class:`CupertinoTableIndex`
+        :param letters: New value of :attr:`letters`
+        """
+
+        self.clear_widgets()
+        for letter in letters:
+            self.add_widget(CupertinoLabel(text=letter, bold=True, font_size=self.font_size, color=self.color))
+        self._trigger_jumps()
+
+    def _update_labels(self, *args):
+        """
+        Callback when :attr:`font_size` or :attr:`color` is changed, updating the labels of the letters
+
+        :param args: Arguments of the callback
+        """
+
+        for label in self.children:
+            label.font_size = self.font_size
+            label.color = self.color
+
+    def on_table(self, instance, table):
+        """
+        Callback when :attr:`table` is changed
+
+        :param instance: Instance of :class:`CupertinoTableIndex`
+        :param table: New value of :attr:`table`
+        """
+
+        if self._bound_model is not None:
+            self._bound_model.unbind(on_data_changed=self._trigger_jumps)
+            self._bound_model = None
+        if table is not None:
+            self._bound_model = table.data_model
+            self._bound_model.bind(on_data_changed=self._trigger_jumps)
+        self._trigger_jumps()
+
+    def _compute_jumps(self, *args):
+        """
+        Compute the index of the row of :attr:`table` that every letter of :attr:`letters` jumps to. A letter no row
+        starts with jumps to the row of the next letter
+        """
+
+        letters = self.letters
+        data = self.table.data if self.table is not None else None
+        if not data:
+            self._jumps = [0] * len(letters)
+            return
+
+        fallback = '#' if '#' in letters else None
+        known = set(letters)
+        key_text = self.key_text
+        first = {}
+        for index, item in enumerate(data):
+            text = item.get(key_text)
+            if text:
+                letter = text.lstrip()[:1].upper()
+                first.setdefault(letter if letter in known else fallback, index)
+
+        jumps = [0] * len(letters)
+        following = len(data) - 1
+        for position in range(len(letters) - 1, -1, -1):
+            following = jumps[position] = first.get(letters[position], following)
+        self._jumps = jumps
+
+    def _jump(self, touch):
+        """
+        Scroll :attr:`table` to the letter under a touch, doing nothing if it is the letter jumped to last
+
+        :param touch: Touch on :class:`CupertinoTableIndex`
+        """
+
+        if self.table is None or not self._jumps or self.height <= 0:
+            return
+
+        position = int((self.top - touch.y) / self.height * len(self._jumps))
+        position = min(max(position, 0), len(self._jumps) - 1)
+        if position != self._letter:
+            self._letter = position
+            self.table.scroll_to_index(self._jumps[position])
+
+    def on_touch_down(self, touch):
+        """
+        Callback when :class:`CupertinoTableIndex` is pressed
+
+        :param touch: Touch on :class:`CupertinoTableIndex`
+        """
+
+        if self.collide_point(*touch.pos):
+            touch.grab(self)
+            self._letter = None
+            self._jump(touch)
+            return True
+        return super().on_touch_down(touch)
+
+    def on_touch_move(self, touch):
+        """
+        Callback when :class:`CupertinoTableIndex` is scrubbed
+
+        :param touch: Touch on :class:`CupertinoTableIndex`
+        """
+
+        if touch.grab_current is self:
+            self._jump(touch)
+            return True
+        return super().on_touch_move(touch)
+
+    def on_touch_up(self, touch):
+        """
+        Callback when :class:`CupertinoTableIndex` is released
+
+        :param touch: Touch on :class:`CupertinoTableIndex`
+        """
+
+        if touch.grab_current is self:
+            touch.ungrab(self)
+            return True
+        return super().on_touch_up(touch)
+
+
+class CupertinoPagedDataSource(EventDispatcher):
+    """
+    Data source that loads the :attr:`~CupertinoTableView.data` of a :class:`CupertinoTableView` one page at a
+    time as it is scrolled, keeping only a window of pages in memory
+
+    **Python**
+
+    .. code-block:: python
+
+       def load_page(page, page_size, cancelled):
+           rows = database.execute('SELECT id, name FROM products LIMIT ? OFFSET ?', (page_size, page * page_size))
+           return [{'id': row[0], 'text': row[1]} for row in rows]
+
+       CupertinoPagedDataSource(table=CupertinoTableView(), loader=load_page)
+    """
+
+    table = ObjectProperty(None, allownone=True)
+    """
+    Instance of :class:`CupertinoTableView` whose :attr:`~CupertinoTableView.data` is loaded by
+    :class:`CupertinoPagedDataSource`
+    """
+
+    loader = ObjectProperty(None)
+    """
+    Callable taking a page index, :attr:`page_size` and a :class:`threading.Event` set when the request is cancelled,
+    and returning a list of items of :attr:`~CupertinoTableView.data`. A regular callable is run in a separate
+    thread, and a coroutine function is run as a task of the running :mod:`asyncio` event loop. Returning fewer
+    than :attr:`page_size` items marks the end of the data
+    """
+
+    page_size = NumericProperty(50)
+    """
+    Amount of items requested from :attr:`loader` at a time
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoPagedDataSource(page_size=100)
+    """
+
+    prefetch_distance = NumericProperty(dp(500))
+    """
+    Distance from the end of the loaded rows at which the next page is requested
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoPagedDataSource(prefetch_distance=1000)
+    """
+
+    max_pages = NumericProperty(5)
+    """
+    Maximum amount of pages kept in memory. Loading a page beyond it evicts the page at the opposite end of the
+    window, which is loaded again when scrolled back to
+    
+    **Python**
+    
+    .. code-block:: python
+    
+       CupertinoPagedDataSource(max_pages=10)
+    """
+
+    loading = BooleanProperty(False)
+    """
+    If :class:`CupertinoPagedDataSource` is waiting for a page from :attr:`loader`
+    """
+
+    exhausted = BooleanProperty(False)
+    """
+    If the last page of the data has been loaded
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize variables of :class:`CupertinoPagedDataSource` and register events
+
+        :param kwargs: Keyword arguments for :class:`CupertinoPagedDataSource`
+        """
+
+        self._pages = {}
+        self._first_page = 0
+        self._last_page = -1
+        self._request = None
+        self._token = 0
+        self._bound_table = None
+        self._data_changed = False
+        self._leading_row = {'viewclass': 'CupertinoTableLoadingCell'}
+        self._trailing_row = {'viewclass': 'CupertinoTableLoadingCell'}
+        self._trigger_check = Clock.create_trigger(self._check_viewport)
+        self._trigger_reload = Clock.create_trigger(lambda dt: self.reload())
+        self.register_event_type('on_page_loaded')
+        super().__init__(**kwargs)
+
+    def on_table(self, instance, table):
+        """
+        Callback when :attr:`table` is changed
+
+        :param instance: Instance of :class:`CupertinoPagedDataSource`
+        :param table: New value of :attr:`table`
+        """
+
+        previous = self._bound_table
+        if previous is not None:
+            previous.unbind(scroll_y=self._trigger_check, height=self._trigger_check)
+            if previous.layout_manager is not None:
+                previous.layout_manager.unbind(height=self._trigger_check)
+
+        self._bound_table = table
+        if table is not None:
+            table.bind(scroll_y=self._trigger_check, height=self._trigger_check)
+            table.layout_manager.bind(height=self._trigger_check)
+            self._trigger_reload()
+
+    def on_loader(self, instance, loader):
+        """
+        Callback when :attr:`loader` is changed
+
+        :param instance: Instance of :class:`CupertinoPagedDataSource`
+        :param loader: New value of :attr:`loader`
+        """
+
+        self._trigger_reload()
+
+    def reload(self):
+        """
+        Discard all loaded pages and load the data again from the first page, once both :attr:`table` and
+        :attr:`loader` are set
+        """
+
+        if self.table is None or self.loader is None:
+            return
+        self._cancel_request()
+        self._pages.clear()
+        self._first_page = 0
+        self._last_page = -1
+        self.exhausted = False
+        self._request_page(0)
+
+    def _cancel_request(self):
+        """
+        Cancel the page currently requested from :attr:`loader` so its result is discarded
+        """
+
+        if self._request is not None:
+            page, cancelled, task = self._request
+            cancelled.set()
+            if task is not None:
+                task.cancel()
+            self._request = None
+            self._token += 1
+            self.loading = False
+
+    def _request_page(self, page):
+        """
+        Request a page from :attr:`loader`, cancelling any other requested page
+
+        :param page: Index of the page
+        """
+
+        if self._request is not None:
+            if self._request[0] == page:
+                return
+            self._cancel_request()
+
+        self._token += 1
+        token = self._token
+        cancelled = Event()
+        self._request = [page, cancelled, None]
+        self.loading = True
+        self._update_data()
+
+        if asyncio.iscoroutinefunction(self.loader):
+            self._request[2] = asyncio.ensure_future(self._load_async(page, token, cancelled))
+        else:
+            Thread(target=self._load_threaded, args=(page, token, cancelled), daemon=True).start()
+
+    def _load_threaded(self, page, token, cancelled):
+        """
+        Load a page from :attr:`loader` in a separate thread
+
+        :param page: Index of the page
+        :param token: Identifier of the request
+        :param cancelled: Event set when the request is cancelled
+        """
+
+        try:
+            items, error = self.loader(page, self.page_size, cancelled), None
+        except Exception as exception:
+            items, error = None, exception
+        if not cancelled.is_set():
+            Clock.schedule_once(lambda dt: self._complete_request(page, token, items, error))
+
+    async def _load_async(self, page, token, cancelled):
+        """
+        Load a page from :attr:`loader` in the running :mod:`asyncio` event loop
+
+        :param page: Index of the page
+        :param token: Identifier of the request
+        :param cancelled: Event set when the request is cancelled
+        """
+
+        try:
+            items, error = await self.loader(page, self.page_size, cancelled), None
+        except asyncio.CancelledError:
+            return
+        except Exception as exception:
+            items, error = None, exception
+        self._complete_request(page, token, items, error)
+
+    def _complete_request(self, page, token, items, error):
+        """
+        Callback when a page has been loaded by :attr:`loader`, discarding it if the request is stale
+
+        :param page: Index of the page
+        :param token: Identifier of the request
+        :param items: Items of the page
+        :param error: Exception raised by :attr:`loader`, if any
+        """
+
+        if token != self._token or self._request is None:
+            return
+        self._request = None
+        self.loading = False
+
+        if error is not None:
+            Logger.error(f'Kivy Cupertino: Unable to load page {page} ({error!r})')
+            self._update_data()
+            return
+
+        items = list(items)
+        if not items:
+            # An empty page only marks the end of the data, so it is not kept where it would count against max_pages
+            if page > self._last_page:
+                self.exhausted = True
+            self._update_data()
+            self.dispatch('on_page_loaded', page, items)
+            return
+
+        self._pages[page] = items
+        if page > self._last_page:
+            self._last_page = page
+            self.exhausted = len(items) < self.page_size
+        if page < self._first_page or len(self._pages) == 1:
+            self._first_page = page
+
+        while len(self._pages) > max(self.max_pages, 1):
+            if page == self._last_page:
+                del self._pages[self._first_page]
+                self._first_page += 1
+            else:
+                del self._pages[self._last_page]
+                self._last_page -= 1
+                self.exhausted = False
+
+        self._update_data()
+        self.dispatch('on_page_loaded', page, items)
+        self._trigger_check()
+
+    def _update_data(self):
+        """
+        Set :attr:`~CupertinoTableView.data` of :attr:`table` to the loaded pages, adding a loading row at the end
+        where a page is being requested
+        """
+
+        if self.table is None:
+            return
+
+        data = []
+        requested = self._request[0] if self._request is not None else None
+        if requested is not None and requested < self._first_page:
+            data.append(self._leading_row)
+        for page in range(self._first_page, self._last_page + 1):
+            data.extend(self._pages.get(page, []))
+        if requested is not None and requested > self._last_page:
+            data.append(self._trailing_row)
+        self._data_changed = True
+        self.table.data = data
+
+    def _check_viewport(self, *args):
+        """
+        Callback when :attr:`table` is scrolled, requesting the page next to the visible area when it comes within
+        :attr:`prefetch_distance` of the end of the loaded rows, and cancelling a requested page which is no longer
+        close to the visible area
+        """
+
+        table = self.table
+        if table is None or table.layout_manager is None:
+            return
+
+        top = table._get_scroll_top()
+        bottom = table.layout_manager.height - top - table.height
+
+        # The viewport may still be settling on the first check after the data changes, so a request is only
+        # cancelled once it is well out of the range it is requested in on a later check
+        data_changed, self._data_changed = self._data_changed, False
+        if self._request is not None and not data_changed:
+            page = self._request[0]
+            distance = bottom if page > self._last_page else top
+            if distance > self.prefetch_distance * 3:
+                self._cancel_request()
+                self._update_data()
+
+        if not self.exhausted and bottom < self.prefetch_distance:
+            self._request_page(self._last_page + 1)
+        elif self._first_page > 0 and top < self.prefetch_distance:
+            self._request_page(self._first_page - 1)
+
+    def on_page_loaded(self, page, items):
+        """
+        Event when a page has been loaded
+
+        :param page: Index of the page
+        :param items: Items of the page
+        """